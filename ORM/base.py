@@ -2,14 +2,22 @@
 Defines the core components of the ORM, including the BaseModel, ModelMeta,
 and base database interaction methods like create_table, insert, delete, update.
 """
+import hashlib
+import logging
 import os
 import sqlite3
+from itertools import chain, islice, repeat
+from operator import attrgetter, itemgetter
 from ORM.fields import ForeignKey, OneToOneField, ManyToManyField
 from ORM.datatypes import Field
 from ORM.query import Manager
+from ORM.connection import (DB_PATH, MAX_IN_PARAMS, _ensure_db_exists, _get_conn,
+                            close_connections)
 
-DB_PATH = "databases/main.sqlite3"
+_log = logging.getLogger(__name__)
 
+# SQLITE_MAX_VARIABLE_NUMBER: 32766 since SQLite 3.32, 999 before that.
+MAX_INSERT_PARAMS = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
 
 class ModelMeta(type):
     """Metaclass for ORM models."""
@@ -31,8 +39,78 @@ class ModelMeta(type):
 
         attrs["_fields"] = fields
         attrs["_many_to_many"] = many_to_many
+
+        # Per-class schema metadata, computed once instead of on every call
+        attrs["_table_name"] = name.lower()
+        attrs["_fk_fields"] = frozenset(
+            field_name for field_name, field in fields.items()
+            if isinstance(field, (ForeignKey, OneToOneField)))
+        attrs["_o2o_fields"] = tuple(
+            field_name for field_name, field in fields.items()
+            if isinstance(field, OneToOneField))
+        # Parallel per-field tuples for loops that walk every field: name,
+        # DB column, and the related model for FK/O2O fields (None otherwise)
+        attrs["_field_names"] = tuple(fields)
+        attrs["_field_db_cols"] = tuple(
+            field_name + "_id" if field_name in attrs["_fk_fields"] else field_name
+            for field_name in fields)
+        attrs["_field_fk_targets"] = tuple(
+            field.to if field_name in attrs["_fk_fields"] else None
+            for field_name, field in fields.items())
+        for field in many_to_many.values():
+            field.bind_source(attrs["_table_name"])
+        # (junction table, source column, target column) per M2M field
+        attrs["_m2m_junction_names"] = {
+            field_name: (field.junction_table,
+                         f"{field.source_name}_id",
+                         f"{field.target_name}_id")
+            for field_name, field in many_to_many.items()}
+        # One round trip returning (field position, related id) for every M2M field
+        attrs["_m2m_ids_sql"] = " UNION ALL ".join(
+            f"SELECT {position}, {target_column} FROM {junction_table} WHERE {source_column} = ?"
+            for position, (junction_table, source_column, target_column)
+            in enumerate(attrs["_m2m_junction_names"].values())
+        ) + " ORDER BY 1, 2" if many_to_many else None
+        # Foreign keys are stored as "<field_name>_id"
+        attrs["_db_column_names"] = dict(zip(attrs["_field_names"], attrs["_field_db_cols"]))
+        # Store instance data in slots instead of a per-instance __dict__.
+        # The Field definitions stay available in _fields, so they can make
+        # way for the slot descriptors. BaseModel keeps a "__dict__" slot,
+        # so attributes outside the schema can still be set when needed.
+        if "__slots__" not in attrs:
+            for field_name in fields:
+                del attrs[field_name]
+            attrs["__slots__"] = (
+                *fields,
+                *(column for field_name, column in attrs["_db_column_names"].items()
+                  if field_name in attrs["_fk_fields"]),
+                *(field.manager_attr for field in many_to_many.values()),
+            )
         new_class = super().__new__(cls, name, bases, attrs)
 
+        # These statements only depend on the schema, so build them once
+        (new_class._insert_field_names_model,
+         new_class._insert_field_names_db,
+         new_class._insert_row_placeholders,
+         new_class._insert_sql) = new_class._prepare_insert_sql()
+        (new_class._row_from_dict,
+         new_class._row_from_instance) = new_class._prepare_row_readers()
+        new_class._drop_sql = f"DROP TABLE IF EXISTS {new_class._table_name}"
+        (new_class._create_script,
+         new_class._schema_table_names,
+         new_class._schema_hash) = new_class._prepare_create_sql()
+        new_class._multi_row_sql_cache = {(1, False): new_class._insert_sql}
+        new_class._delete_all_sql = f"DELETE FROM {new_class._table_name}"
+        # Everything __init__ sets: the id, the fields and the FK *_id columns
+        new_class._init_attr_names = (
+            "id", *fields,
+            *(column for field_name, column in attrs["_db_column_names"].items()
+              if field_name in attrs["_fk_fields"]))
+        new_class._instance_slots = tuple(
+            slot for klass in reversed(new_class.__mro__)
+            for slot in klass.__dict__.get("__slots__", ())
+            if slot not in ("__dict__", "__weakref__"))
+
         return new_class
 
 # ====================================================
@@ -46,112 +124,237 @@ class BaseModel(metaclass=ModelMeta):
     database interaction (CRUD), field handling, and instance representation.
     Subclass this to define your application models.
     """
+    # "__dict__" keeps instances open to attributes outside the schema;
+    # subclasses get one slot per field from ModelMeta
+    __slots__ = ("id", "__dict__", "__weakref__")
     objects = Manager()
-    id = None  # Initialize id attribute
 
     def __init__(self, **kwargs):
         """
         Initializes a model instance.
-        Sets attributes based on provided keyword arguments.
-        Defaults fields not provided in kwargs to None.
-        Ensures 'id' is initialized, defaulting to None.
+        Sets 'id', every field and every FK *_id column from the keyword
+        arguments, defaulting the ones not provided to None.
+        Other keyword arguments are ignored.
         """
-        # Initialize all defined fields (_fields comes from metaclass)
-        for field_name in self._fields:
-            # Get the value from kwargs if provided, otherwise default to None
-            value = kwargs.get(field_name, None)
-            setattr(self, field_name, value)
-
-        # Handle 'id' specifically - it might be in kwargs or should be None initially
-        self.id = kwargs.get('id', None)
+        # One pass over the names cached by ModelMeta; no per-field checks
+        get = kwargs.get
+        for attr_name in self._init_attr_names:
+            setattr(self, attr_name, get(attr_name))
 
     def __repr__(self):
         """Return a string representation of the model instance."""
-        # Use the instance's ID if available, otherwise indicate it's unsaved
-        string = ", ".join(f"{k}={value!r}" for k,
-                           value in self.__dict__.items())
+        # Show the slots that are set, then any extra attributes
+        items = [(name, getattr(self, name)) for name in self._instance_slots
+                 if hasattr(self, name)]
+        items.extend(self.__dict__.items())
+        string = ", ".join(f"{k}={value!r}" for k, value in items)
         return f"<{self.__class__.__name__}: {string}>"
 
-    def as_dict(self):
-        """Return a dictionary representation of the model instance."""
+    def __conform__(self, protocol):
+        """
+        Let sqlite3 bind a model instance as its id, so related objects can
+        be passed straight through as query parameters.
+        """
+        if protocol is sqlite3.PrepareProtocol:
+            return self.id
+        return None
+
+    def _field_values_dict(self):
+        """Return the id plus regular and FK/O2O (as *_id) values of the instance."""
         data = {'id': self.id}
         # Handle regular fields and FK/O2O fields
-        for field_name, field in self._fields.items():
-            if isinstance(field, (ForeignKey, OneToOneField)):
+        for field_name, fk_id_attr, related_model in zip(
+                self._field_names, self._field_db_cols, self._field_fk_targets):
+            if related_model is not None:
                 # For FK/O2O, store the related object's ID
                 # Check for the _id attribute first (set during loading)
-                fk_id_attr = field_name + '_id'
                 fk_id = getattr(self, fk_id_attr, None)
 
                 # Check fk_id is still None
                 if fk_id is None and hasattr(self, field_name):
                     potential_related_obj = getattr(self, field_name)
-                    if isinstance(potential_related_obj, field.to) and potential_related_obj.id is not None:
+                    if isinstance(potential_related_obj, related_model) and potential_related_obj.id is not None:
                         fk_id = potential_related_obj.id
 
                 data[fk_id_attr] = fk_id
             else:
                 # Regular field
                 data[field_name] = getattr(self, field_name, None)
+        return data
 
-        # Handle M2M fields
-        for field_name in self._many_to_many:  # Iterate through field names
-            # M2M relationships require the instance to have an ID
-            if self.id is not None:
-                try:
-                    # Get the manager instance for this field on this specific object
-                    # Accessing self.<field_name> (e.g., self.courses) triggers the descriptor's __get__
-                    manager = getattr(self, field_name)
-
-                    # Call the manager's all() method, which returns a QuerySet
-                    related_queryset = manager.all()
-
-                    # Extract the IDs from the related instances in the QuerySet
-                    data[field_name] = [
-                        instance.id for instance in related_queryset if instance.id is not None]
-                except Exception as e:
-                    # Handle potential errors during M2M fetch gracefully
-                    print(
-                        f"Warning: Could not fetch M2M field '{field_name}' for {self}: {e}")
+    def as_dict(self):
+        """Return a dictionary representation of the model instance."""
+        data = self._field_values_dict()
+
+        # Handle M2M fields; an unsaved instance can't have M2M relations yet
+        field_names = list(self._many_to_many)
+        for field_name in field_names:
+            data[field_name] = []
+        if self.id is not None and field_names:
+            try:
+                # Read only the related ids straight from the junction tables
+                for position, related_id in self._fetch_m2m_ids():
+                    data[field_names[position]].append(related_id)
+            except Exception as e:
+                # Handle potential errors during M2M fetch gracefully
+                _log.warning("Could not fetch M2M fields for %s(id=%s): %s",
+                             self.__class__.__name__, self.id, e)
+                for field_name in field_names:
                     data[field_name] = []  # Represent as empty list on error
-            else:
-                # If the instance isn't saved, it can't have M2M relations yet
-                data[field_name] = []  # Represent as empty list
 
         return data
 
+    def _fetch_m2m_ids(self):
+        """
+        Return a cursor over (M2M field position, related id) rows for this
+        instance. Rows are streamed into as_dict as SQLite produces them
+        rather than collected into an intermediate list first.
+        """
+        return _get_conn().execute(
+            self._m2m_ids_sql, (self.id,) * len(self._many_to_many))
+
     @classmethod
-    def create_table(cls):
+    def bulk_as_dict(cls, instances):
         """
-        Creates the database table for this model, including columns for
-        all defined fields and junction tables for ManyToManyFields.
-        Drops the table if it already exists before creating.
+        Return the as_dict() representation of many instances at once.
+
+        M2M fields are loaded with one junction-table query per field for the
+        whole batch instead of one query per instance and field.
+
+        Args:
+            instances (list): Instances of this model.
+
+        Returns:
+            list: One dictionary per instance, in the same order.
         """
-        if not os.path.exists('databases'):
-            os.makedirs('databases')
+        ids = [instance.id for instance in instances if instance.id is not None]
+        related_ids = {field_name: {} for field_name in cls._many_to_many}
+        if ids and cls._many_to_many:
+            connection_obj = _get_conn()
+            for field_name, (junction_table, source_column, target_column) in cls._m2m_junction_names.items():
+                ids_by_source = related_ids[field_name]
+                for start in range(0, len(ids), MAX_IN_PARAMS):
+                    chunk = ids[start:start + MAX_IN_PARAMS]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = connection_obj.execute(
+                        f"SELECT {source_column}, {target_column} FROM {junction_table} "
+                        f"WHERE {source_column} IN ({placeholders}) ORDER BY {target_column}",
+                        chunk)
+                    for source_id, target_id in rows:
+                        ids_by_source.setdefault(source_id, []).append(target_id)
+
+        result = []
+        for instance in instances:
+            data = instance._field_values_dict()
+            for field_name in cls._many_to_many:
+                # Unsaved instances cannot have M2M relations yet
+                data[field_name] = list(related_ids[field_name].get(instance.id, []))
+            result.append(data)
+        return result
+
+    @classmethod
+    def bulk_link_m2m(cls, field_name, pairs):
+        """
+        Link many (source, target) pairs of a ManyToManyField at once.
+
+        Pairs are written with multi-row INSERT OR IGNORE statements, so
+        links that already exist are skipped by the junction table's
+        UNIQUE constraint. Source instances drop their prefetched related
+        objects, like the manager's own write methods do.
+
+        Args:
+            field_name (str): Name of the ManyToManyField on this model.
+            pairs (iterable): (source, target) tuples of instances, dicts
+                              with an 'id' key, or plain IDs.
+
+        Returns:
+            int: The number of links that were added.
+
+        Raises:
+            TypeError: If an instance in a pair is not of the source or
+                       target model.
+            ValueError: If field_name is not a ManyToManyField of this model,
+                        or an instance in a pair is unsaved.
+        """
+        if field_name not in cls._m2m_junction_names:
+            raise ValueError(f"'{field_name}' is not a ManyToManyField of {cls.__name__}")
+        junction_table, source_column, target_column = cls._m2m_junction_names[field_name]
+        insert_prefix = (f"INSERT OR IGNORE INTO {junction_table} "
+                         f"({source_column}, {target_column}) VALUES ")
+        rows_per_statement = max(1, MAX_INSERT_PARAMS // 2)
+        field = cls._many_to_many[field_name]
+        manager_attr = field.manager_attr
+
+        def check_instance(value, model, model_name):
+            # Same checks as the manager's add(); dicts and plain IDs pass as given
+            if not isinstance(value, BaseModel):
+                return
+            if not isinstance(value, model):
+                raise TypeError(f"Can only link '{model.__name__}' instances.")
+            if value.id is None:
+                raise ValueError(f"Cannot link unsaved '{model_name}' instance in M2M relationship.")
 
-        table_name = cls.__name__.lower()
-        connection_obj = sqlite3.connect(DB_PATH)
-        cursor_obj = connection_obj.cursor()
+        pairs = iter(pairs)
+        linked_count = 0
+        connection_obj = _get_conn()
+        with connection_obj:
+            connection_obj.execute("BEGIN")
+            while True:
+                chunk = list(islice(pairs, rows_per_statement))
+                if not chunk:
+                    break
+                for source, target in chunk:
+                    check_instance(source, cls, field.source_name)
+                    check_instance(target, field.to, field.target_name)
+                cursor_obj = connection_obj.execute(
+                    insert_prefix + ", ".join(["(?, ?)"] * len(chunk)),
+                    [cls._fk_id(value) for pair in chunk for value in pair])
+                linked_count += cursor_obj.rowcount
+                for source, _ in chunk:
+                    # Only instances whose manager was already created hold a cache
+                    manager = getattr(source, manager_attr, None)
+                    if manager is not None:
+                        manager._prefetched = None
+        _log.debug("Linked %d %s pairs on %s", linked_count, field_name, cls.__name__)
+        return linked_count
+
+    @classmethod
+    def _prepare_create_sql(cls):
+        """
+        Prepare the script that rebuilds the model's table and its junction
+        tables in one transaction, the names of those tables, and a hash
+        identifying the schema.
+        """
+        table_name = cls._table_name
         fields_sql = ["id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL"]
 
         for field_name, field in cls._fields.items():
-            if isinstance(field, (ForeignKey, OneToOneField)):
+            if field_name in cls._fk_fields:
                 # Store foreign keys as "<field_name>_id"
-                column_name = field_name + "_id"
+                column_name = cls._db_column_names[field_name]
                 ref_table = field.to.__name__.lower()  # get referenced table
                 # delete everything if id deleted
+                # get_db_type() carries the field's constraints, e.g. the
+                # UNIQUE that makes a OneToOneField one-to-one in the DB
                 fields_sql.append(
-                    f"{column_name} {field.db_type} REFERENCES {ref_table}(id) ON DELETE CASCADE")
+                    f"{column_name} {field.get_db_type()} REFERENCES {ref_table}(id) ON DELETE CASCADE")
             else:
                 fields_sql.append(f"{field_name} {field.get_db_type()}")
-        cursor_obj.execute(f"DROP TABLE IF EXISTS {table_name}")
-        cursor_obj.execute(
-            f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(fields_sql)});")
 
+        table_names = [table_name]
+        ddl = [f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(fields_sql)});"]
+        # SQLite does not index FK columns by itself; without an index every
+        # filter or cascading delete on them scans the table. Fields declared
+        # with index=True get one too. UNIQUE columns (OneToOne) already have one.
+        for field_name, column_name in zip(cls._field_names, cls._field_db_cols):
+            field = cls._fields[field_name]
+            if (field_name in cls._fk_fields or field.index) and not field.unique:
+                ddl.append(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{column_name} "
+                           f"ON {table_name}({column_name});")
         for field_name, field in cls._many_to_many.items():
-            junction_table = field.through or f"{table_name}_{field.to.__name__.lower()}"
-            cursor_obj.execute(f"""
+            junction_table, _, target_column = cls._m2m_junction_names[field_name]
+            table_names.append(junction_table)
+            ddl.append(f"""
                 CREATE TABLE IF NOT EXISTS {junction_table} (
                     id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
                     {table_name}_id INTEGER REFERENCES {table_name}(id) ON DELETE CASCADE,
@@ -159,20 +362,94 @@ class BaseModel(metaclass=ModelMeta):
                     UNIQUE({table_name}_id, {field.to.__name__.lower()}_id)
                 );
             """)
-        connection_obj.close()
+            # UNIQUE(source, target) covers lookups by source; index the target too
+            ddl.append(f"CREATE INDEX IF NOT EXISTS idx_{junction_table}_{target_column} "
+                       f"ON {junction_table}({target_column});")
+        schema_hash = hashlib.sha1("".join(ddl).encode()).hexdigest()
+        # Junction tables are dropped along with the model's table, so a
+        # changed M2M definition is recreated rather than kept in its old shape
+        drop_sql = "".join(f"DROP TABLE IF EXISTS {name};\n" for name in table_names[1:])
+        create_script = "".join([
+            "BEGIN;\n",
+            f"{cls._drop_sql};\n",
+            drop_sql,
+            *ddl,
+            f"INSERT OR REPLACE INTO __orm_schema__ (name, hash) VALUES ('{table_name}', '{schema_hash}');\n",
+            "COMMIT;",
+        ])
+        return create_script, tuple(table_names), schema_hash
+
+    @classmethod
+    def create_table(cls, force=False):
+        """
+        Creates the database table for this model, including columns for
+        all defined fields and junction tables for ManyToManyFields.
+        Drops and recreates the table if its schema changed since the last
+        call; leaves it (and its data) untouched if the schema is the same,
+        so re-running migrations is a no-op.
+
+        A rebuild only resets this model's own table and its junction
+        tables: foreign keys are switched off around the DROP, so rows in
+        other tables that reference this one are kept (their FK values are
+        left pointing at ids that no longer exist).
+
+        Args:
+            force (bool, optional): Drop and recreate the tables even if the
+                                    schema is unchanged. Defaults to False.
+        """
+        if not os.path.exists('databases'):
+            os.makedirs('databases')
+
+        table_name = cls._table_name
+        table_names = cls._schema_table_names
+        schema_hash = cls._schema_hash
+        connection_obj = _get_conn()
+
+        with connection_obj:
+            connection_obj.execute("BEGIN")
+            connection_obj.execute(
+                "CREATE TABLE IF NOT EXISTS __orm_schema__ (name TEXT PRIMARY KEY, hash TEXT)")
+            row = connection_obj.execute(
+                "SELECT hash FROM __orm_schema__ WHERE name = ?", (table_name,)).fetchone()
+            if not force and row is not None and row[0] == schema_hash:
+                # Same schema: skip the rebuild as long as every table is still there
+                placeholders = ", ".join("?" * len(table_names))
+                table_count = connection_obj.execute(
+                    f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+                    table_names).fetchone()[0]
+                if table_count == len(table_names):
+                    return
+
+        # DROP TABLE does an implicit DELETE, which with foreign keys on would
+        # cascade into every table referencing this one. The pragma is a no-op
+        # inside a transaction, so switch it around the script.
+        connection_obj.execute("PRAGMA foreign_keys=OFF")
+        try:
+            # All DDL for the model (and its junction tables) is parsed and
+            # committed in one script
+            connection_obj.executescript(cls._create_script)
+        except sqlite3.Error:
+            if connection_obj.in_transaction:
+                connection_obj.rollback()
+            raise
+        finally:
+            connection_obj.execute("PRAGMA foreign_keys=ON")
 
     # TODO: M2M and insert entries are separate functions. Merge them.
     @classmethod
     def _validate_insert_input(cls, entries) -> bool:
         """
-        Validate the list of entries for insertion.
+        Validate the list of entries for insertion by its first entry.
+        The remaining entries are checked by _check_entry_type while their
+        rows are built, so the batch is not scanned twice.
 
-        Returns True if entries are dictionaries, False if they are model instances.
+        Returns True if entries are dictionaries, False if they are model
+        instances, and None if there are no entries.
         Raises TypeError if entries are neither dictionaries nor model instances.
         """
         if not entries:
-            print("No entries provided to insert.")
-            return None, None  # Indicate no processing needed
+            _log.debug("No entries provided to insert.")
+            return None  # Indicate no processing needed
 
         first_entry = entries[0]
         is_dict_input = isinstance(first_entry, dict)
@@ -181,140 +458,280 @@ class BaseModel(metaclass=ModelMeta):
         if not is_dict_input and not is_model_instance_input:
             raise TypeError(
                 "Entries must be a list of dictionaries or BaseModel instances.")
-
-        # Check type consistency
-        for entry in entries:
-            if is_dict_input and not isinstance(entry, dict):
-                raise TypeError("All entries must be dictionaries.")
-            if is_model_instance_input and not isinstance(entry, BaseModel):
-                raise TypeError("All entries must be BaseModel instances.")
-            if is_model_instance_input and not isinstance(entry, cls):
-                raise TypeError(
-                    f"All entries must be instances of {cls.__name__}")
+        cls._check_entry_type(first_entry, is_dict_input)
 
         return is_dict_input
 
+    @classmethod
+    def _check_entry_type(cls, entry, is_dict_input):
+        """Raise TypeError if an entry does not match the type of the first entry."""
+        if is_dict_input:
+            if not isinstance(entry, dict):
+                raise TypeError("All entries must be dictionaries.")
+        elif not isinstance(entry, BaseModel):
+            raise TypeError("All entries must be BaseModel instances.")
+        elif not isinstance(entry, cls):
+            raise TypeError(
+                f"All entries must be instances of {cls.__name__}")
+
     @classmethod
     def _prepare_insert_sql(cls):
         """Prepare SQL query components for insertion."""
-        field_names_db = []
-        field_names_model = []
-        for field_name, field in cls._fields.items():
-            field_names_model.append(field_name)
-            if isinstance(field, (ForeignKey, OneToOneField)):
-                field_names_db.append(field_name + "_id")
-            else:
-                field_names_db.append(field_name)
+        field_names_model = list(cls._field_names)
+        field_names_db = list(cls._field_db_cols)
 
-        placeholders = ", ".join(["?" for _ in field_names_db])
+        # One "(?, ?, ...)" group per row; multi-row INSERTs repeat it
+        row_placeholders = "(" + ", ".join(["?" for _ in field_names_db]) + ")"
         columns = ", ".join(field_names_db)
-        query = f"INSERT INTO {cls.__name__.lower()} ({columns}) VALUES ({placeholders})"
-        return field_names_model, field_names_db, query
+        query = f"INSERT INTO {cls._table_name} ({columns}) VALUES {row_placeholders}"
+        return field_names_model, field_names_db, row_placeholders, query
 
     @classmethod
-    def _extract_value_for_db(cls, entry, model_field_name, field, is_dict_input):
-        """Extract and process a single value from an entry for DB insertion."""
-        value = None
-        if is_dict_input:
-            raw_value = entry.get(model_field_name)
-            if isinstance(field, (ForeignKey, OneToOneField)):
-                if isinstance(raw_value, dict):
-                    value = raw_value.get('id')
-                elif isinstance(raw_value, BaseModel):
-                    value = getattr(raw_value, 'id', None)
-                else:  # Assume it's the ID
-                    value = raw_value
-            else:
-                value = raw_value
-        else:  # is_model_instance_input
-            raw_value = getattr(entry, model_field_name, None)
-            if isinstance(field, (ForeignKey, OneToOneField)):
-                value = getattr(raw_value, 'id', None) if raw_value else None
-            else:
-                value = raw_value
-        return value
+    def _prepare_row_readers(cls):
+        """
+        Build the functions that turn one dict or one instance into an
+        insert row, specialised once for this model's columns.
+
+        Every column is read with one C-level call per row, then FK/O2O
+        values are resolved to IDs. Instances loaded from the database only
+        hold the *_id column, so an instance whose relation is None falls
+        back to it. Dicts that omit optional keys fall back to .get.
+        """
+        field_names = tuple(cls._insert_field_names_model)
+        fk_indices = tuple(index for index, name in enumerate(field_names)
+                           if name in cls._fk_fields)
+        fk_id = cls._fk_id
+
+        if not field_names:
+            def read_items(entry):
+                return ()
+            read_attributes = read_items
+        elif len(field_names) == 1:
+            read_item = itemgetter(field_names[0])
+            read_attribute = attrgetter(field_names[0])
+
+            def read_items(entry):
+                return (read_item(entry),)
+
+            def read_attributes(entry):
+                return (read_attribute(entry),)
+        else:
+            read_items = itemgetter(*field_names)
+            read_attributes = attrgetter(*field_names)
+
+        def row_from_dict(entry):
+            try:
+                values = read_items(entry)
+            except KeyError:
+                values = tuple(map(entry.get, field_names))
+            if not fk_indices:
+                return values
+            values = list(values)
+            for index in fk_indices:
+                values[index] = fk_id(values[index])
+            return tuple(values)
+
+        if not fk_indices:
+            row_from_instance = read_attributes
+        else:
+            fk_id_attrs = tuple((index, cls._db_column_names[field_names[index]])
+                                for index in fk_indices)
+
+            def row_from_instance(entry):
+                values = list(read_attributes(entry))
+                for index, id_attr in fk_id_attrs:
+                    value = values[index]
+                    if value is None:
+                        values[index] = getattr(entry, id_attr, None)
+                    else:
+                        values[index] = fk_id(value)
+                return tuple(values)
+
+        return row_from_dict, row_from_instance
 
     @classmethod
-    def _check_onetoone_constraint(cls, cursor_obj, db_field_name, model_field_name, value):
-        """Check for OneToOne constraint violation."""
-        check_query = f"SELECT COUNT(*) FROM {cls.__name__.lower()} WHERE {db_field_name} = ?"
-        cursor_obj.execute(check_query, (value,))
-        if cursor_obj.fetchone()[0] > 0:
-            raise ValueError(
-                f"Duplicate entry detected for {model_field_name} (OneToOneField) with id {value}")
+    def _multi_row_insert_sql(cls, row_count, with_id=False):
+        """
+        Return an INSERT statement with `row_count` rows in its VALUES clause,
+        optionally sending the id as the first column. Statements are cached
+        per row count, so a bulk insert builds at most two of them: one for
+        full chunks and one for the tail.
+        """
+        sql = cls._multi_row_sql_cache.get((row_count, with_id))
+        if sql is not None:
+            return sql
+        if with_id:
+            columns = ", ".join(['id', *cls._insert_field_names_db])
+            row_placeholders = "(" + ", ".join("?" * (len(cls._insert_field_names_db) + 1)) + ")"
+            sql = (f"INSERT INTO {cls._table_name} ({columns}) VALUES "
+                   + ", ".join([row_placeholders] * row_count))
+        else:
+            # The single-row statement already ends with one placeholder group
+            sql = cls._insert_sql + f", {cls._insert_row_placeholders}" * (row_count - 1)
+        cls._multi_row_sql_cache[(row_count, with_id)] = sql
+        return sql
 
     @classmethod
-    def _process_entries_for_values(cls, entries, is_dict_input, field_names_model, field_names_db, cursor_obj):
-        """Process all entries to generate the list of value tuples for executemany."""
-        values = []
-        # Keep track of O2O FK values seen within this batch for each O2O field
-        seen_onetoone_values = {
-            fn: set() for fn, f in cls._fields.items() if isinstance(f, OneToOneField)
-        }
-
-        # Use enumerate for better error context
-        for entry_index, entry in enumerate(entries):
-            row = []
-            for model_field_name, db_field_name in zip(field_names_model, field_names_db):
-                field = cls._fields[model_field_name]
-                value = cls._extract_value_for_db(
-                    entry, model_field_name, field, is_dict_input)
-
-                if isinstance(field, OneToOneField) and value is not None:
-                    # 1. Check for duplicates within the current batch first
-                    if value in seen_onetoone_values[model_field_name]:
-                        # Raise ValueError immediately if duplicate found in batch
-                        raise ValueError(
-                            f"Duplicate entry detected within the batch for OneToOne field '{model_field_name}' with value {value} at index {entry_index}"
-                        )
-                    # Add the value to the set for this batch check
-                    seen_onetoone_values[model_field_name].add(value)
-
-                    # 2. Check against the database (existing check)
-                    try:
-                        cls._check_onetoone_constraint(
-                            cursor_obj, db_field_name, model_field_name, value)
-                    except ValueError as e:
-                        # Add index context if database check fails
-                        raise ValueError(
-                            f"Error processing entry at index {entry_index}: {e}") from e
-
-                row.append(value)
-            values.append(tuple(row))
-        return values
+    def _execute_insert_chunks(cls, connection_obj, rows, with_id=False, suffix=""):
+        """
+        Insert `rows` with multi-row INSERTs holding as many rows as fit
+        under MAX_INSERT_PARAMS, appending `suffix` (e.g. an ON CONFLICT
+        clause) to every statement. Yields (row count, cursor) per statement.
+        """
+        column_count = len(cls._insert_field_names_db) + with_id
+        rows_per_statement = max(1, MAX_INSERT_PARAMS // max(1, column_count))
+        while True:
+            chunk = list(islice(rows, rows_per_statement))
+            if not chunk:
+                return
+            yield len(chunk), connection_obj.execute(
+                cls._multi_row_insert_sql(len(chunk), with_id) + suffix,
+                list(chain.from_iterable(chunk)))
+
+    @staticmethod
+    def _fk_id(raw_value):
+        """Resolve a FK/O2O value given as an instance, a dict or a plain ID."""
+        if isinstance(raw_value, dict):
+            return raw_value.get('id')
+        if isinstance(raw_value, BaseModel):
+            return getattr(raw_value, 'id', None)
+        return raw_value  # Assume it's the ID
 
     @classmethod
-    def _execute_insert(cls, connection_obj, cursor_obj, query, entries, values_list, is_dict_input):
+    def _fetch_existing_onetoone_values(cls, connection_obj, db_field_name, candidate_values):
         """
-        Execute the insert query and handle commit/rollback.
-        Updates instance IDs if inserting model instances one by one.
+        Return the subset of candidate_values already stored in a OneToOne
+        column, using one SELECT ... IN (...) per chunk instead of one per row.
         """
-        try:
+        existing = set()
+        candidates = list(candidate_values)
+        for start in range(0, len(candidates), MAX_IN_PARAMS):
+            chunk = candidates[start:start + MAX_IN_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = connection_obj.execute(
+                f"SELECT {db_field_name} FROM {cls._table_name} WHERE {db_field_name} IN ({placeholders})",
+                chunk)
+            existing.update(row[0] for row in rows)
+        return existing
+
+    @classmethod
+    def _iter_values_for_db(cls, entries, is_dict_input, connection_obj):
+        """
+        Lazily yield one value tuple per entry so the insert only holds one
+        chunk of rows in memory at a time instead of the whole batch.
+        OneToOne uniqueness is checked for the whole batch before the first
+        row is yielded.
+        """
+        cls._check_entry_types(entries, is_dict_input)
+
+        if cls._o2o_fields:
+            cls._check_onetoone_values(entries, is_dict_input, connection_obj)
+
+        yield from map(cls._row_from_dict if is_dict_input else cls._row_from_instance,
+                       entries)
+
+    @classmethod
+    def _check_entry_types(cls, entries, is_dict_input):
+        """
+        Raise TypeError unless every entry is a dict (or every entry a model
+        instance, when is_dict_input is False).
+        """
+        # Exact type match is the fast path; anything else gets the full check
+        entry_type = dict if is_dict_input else cls
+        if not set(map(type, entries)) <= {entry_type}:
+            for entry in entries:
+                cls._check_entry_type(entry, is_dict_input)
+
+    @classmethod
+    def _check_onetoone_values(cls, entries, is_dict_input, connection_obj):
+        """
+        Raise ValueError if a OneToOne value repeats within the batch or is
+        already stored in the database.
+
+        Each OneToOne column is projected once and checked by
+        _check_onetoone_columns.
+        """
+        column_by_field = {}
+        for model_field_name in cls._o2o_fields:
             if is_dict_input:
-                # Use executemany for dictionary inputs (bulk insert)
-                cursor_obj.executemany(query, values_list)
-                print(
-                    f"Successfully inserted {len(values_list)} entries into {cls.__name__}")
+                raw_values = map(dict.get, entries, repeat(model_field_name))
             else:
-                # Insert instances one by one to get lastrowid
-                inserted_count = 0
-                for i, entry_instance in enumerate(entries):
-                    # Get the pre-processed values for this instance
-                    values_tuple = values_list[i]
-                    cursor_obj.execute(query, values_tuple)
-                    # Get the last inserted ID and update the instance
-                    last_id = cursor_obj.lastrowid
-                    entry_instance.id = last_id
-                    inserted_count += 1
-                print(
-                    f"Successfully inserted {inserted_count} entries into {cls.__name__} and updated instance IDs.")
+                raw_values = map(attrgetter(model_field_name), entries)
+            column_by_field[model_field_name] = list(map(cls._fk_id, raw_values))
+        cls._check_onetoone_columns(column_by_field, connection_obj)
+
+    @classmethod
+    def _check_onetoone_columns(cls, column_by_field, connection_obj):
+        """
+        Raise ValueError if a value repeats within or is already stored for
+        one of the OneToOne columns in column_by_field, which maps field
+        names to their values resolved to IDs, one per row.
+
+        Each column is compared as a set; rows are only walked one by one to
+        report the first offending index.
+        """
+        first_error = None
+        for field_order, model_field_name in enumerate(cls._o2o_fields):
+            column = column_by_field[model_field_name]
+            present = [value for value in column if value is not None]
+            existing = cls._fetch_existing_onetoone_values(
+                connection_obj, cls._db_column_names[model_field_name], set(present))
+            if not existing and len(set(present)) == len(present):
+                continue
+
+            seen = set()
+            for entry_index, value in enumerate(column):
+                if value is None:
+                    continue
+                # 1. Check for duplicates within the current batch first
+                if value in seen:
+                    error = (entry_index, field_order,
+                             f"Duplicate entry detected within the batch for OneToOne field '{model_field_name}' with value {value} at index {entry_index}")
+                    break
+                # 2. Check against the values already in the database
+                if value in existing:
+                    error = (entry_index, field_order,
+                             f"Error processing entry at index {entry_index}: "
+                             f"Duplicate entry detected for {model_field_name} (OneToOneField) with id {value}")
+                    break
+                seen.add(value)
+            # Report the error a row-by-row scan would have hit first
+            if first_error is None or error < first_error:
+                first_error = error
+
+        if first_error is not None:
+            raise ValueError(first_error[2])
+
+    @classmethod
+    def _execute_insert(cls, connection_obj, entries, values_iter, is_dict_input):
+        """
+        Execute the insert and handle commit/rollback.
+
+        Rows are inserted with multi-row INSERTs holding as many rows as fit
+        under MAX_INSERT_PARAMS, so one statement execution covers a whole
+        chunk. Updates instance IDs when inserting model instances.
+        """
+        try:
+            inserted_count = 0
+            entry_iter = None if is_dict_input else iter(entries)
+            for chunk_len, cursor_obj in cls._execute_insert_chunks(connection_obj, values_iter):
+                if entry_iter is not None:
+                    # AUTOINCREMENT hands out consecutive ids within one
+                    # statement, so the chunk's ids end at lastrowid. This
+                    # assumes no trigger inserts into this table mid-statement;
+                    # BEGIN IMMEDIATE already keeps other writers out.
+                    # (executemany can't be used: it leaves lastrowid unset.)
+                    first_id = cursor_obj.lastrowid - chunk_len + 1
+                    for offset, entry_instance in enumerate(islice(entry_iter, chunk_len)):
+                        entry_instance.id = first_id + offset
+                inserted_count += chunk_len
+            _log.debug("Inserted %d entries into %s", inserted_count, cls.__name__)
 
             connection_obj.commit()
 
         except Exception as e:
             connection_obj.rollback()
-            # Log or print error
-            print(f"Error during insert into {cls.__name__}: {e}")
+            _log.debug("Error during insert into %s: %s", cls.__name__, e)
             raise  # Re-raise the exception after rollback
 
     @classmethod
@@ -339,28 +756,24 @@ class BaseModel(metaclass=ModelMeta):
         """
         is_dict_input = cls._validate_insert_input(entries)
         if is_dict_input is None:  # Handle case where entries list is empty
-            print("No entries to insert.")
+            _log.debug("No entries to insert.")
             return
 
-        if not os.path.exists(DB_PATH):
-            raise ValueError(f"Database for {cls.__name__} does not exist!")
+        _ensure_db_exists(cls.__name__)
 
         connection_obj = None  # Initialize to None for finally block
         try:
-            connection_obj = sqlite3.connect(DB_PATH)
-            cursor_obj = connection_obj.cursor()
-            cursor_obj.execute("PRAGMA foreign_keys = ON;")
+            connection_obj = _get_conn()
+            # One explicit transaction covers the OneToOne checks and every row.
+            # IMMEDIATE takes the write lock up front, so no other writer can
+            # slip in between the OneToOne prefetch and the INSERTs.
+            connection_obj.execute("BEGIN IMMEDIATE")
 
-            field_names_model, field_names_db, query = cls._prepare_insert_sql()
+            # Rows are produced lazily as each chunk is built
+            values_iter = cls._iter_values_for_db(entries, is_dict_input, connection_obj)
 
-            # Process entries to get values list (needed for both dicts and instances)
-            values_list = cls._process_entries_for_values(
-                entries, is_dict_input, field_names_model, field_names_db, cursor_obj
-            )
-
-            # Pass entries list along with values_list to _execute_insert
-            cls._execute_insert(connection_obj, cursor_obj,
-                                query, entries, values_list, is_dict_input)
+            # Pass entries list along with the row generator to _execute_insert
+            cls._execute_insert(connection_obj, entries, values_iter, is_dict_input)
 
         except Exception as e:
             # Catch potential errors during validation, SQL prep, or processing
@@ -368,15 +781,150 @@ class BaseModel(metaclass=ModelMeta):
                 try:
                     connection_obj.rollback()
                 except Exception as rb_e:
-                    # Log rollback error
-                    print(f"Error during rollback: {rb_e}")
-            # Log or print error
-            print(f"Failed to insert entries into {cls.__name__}: {e}")
+                    _log.error("Error during rollback: %s", rb_e)
+            _log.error("Failed to insert entries into %s: %s", cls.__name__, e)
             # Re-raise the original exception to signal failure
             raise
-        finally:
-            if connection_obj:
-                connection_obj.close()
+
+    @classmethod
+    def insert_columns(cls, columns):
+        """
+        Inserts rows given column-wise: one sequence of values per field.
+        Avoids building (and hashing) a dictionary per row for bulk loads.
+
+        Args:
+            columns (dict): Maps field names to equally sized sequences of
+                            values. Fields that are left out are stored as NULL.
+                            FK/O2O values may be instances, dicts or IDs.
+
+        Returns:
+            int: The number of rows inserted.
+
+        Raises:
+            ValueError: If a column is not a field of the model, the columns
+                        differ in length, or a OneToOne value is duplicated.
+            sqlite3.IntegrityError: If a database constraint is violated.
+        """
+        unknown = set(columns) - set(cls._fields)
+        if unknown:
+            raise ValueError(
+                f"Unknown fields for {cls.__name__}: {', '.join(sorted(unknown))}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+        row_count = lengths.pop() if lengths else 0
+        if not row_count:
+            _log.debug("No rows to insert.")
+            return 0
+
+        _ensure_db_exists(cls.__name__)
+
+        # Columns in INSERT order, with FK/O2O values resolved to IDs
+        ordered_columns = []
+        for field_name in cls._insert_field_names_model:
+            values = columns.get(field_name)
+            if values is None:
+                values = [None] * row_count
+            elif field_name in cls._fk_fields:
+                values = [cls._fk_id(value) for value in values]
+            ordered_columns.append(values)
+        column_by_field = dict(zip(cls._insert_field_names_model, ordered_columns))
+
+        inserted_count = 0
+        connection_obj = _get_conn()
+        with connection_obj:
+            # Write lock up front, as in insert_entries
+            connection_obj.execute("BEGIN IMMEDIATE")
+            if cls._o2o_fields:
+                cls._check_onetoone_columns(column_by_field, connection_obj)
+            for chunk_len, _ in cls._execute_insert_chunks(connection_obj, zip(*ordered_columns)):
+                inserted_count += chunk_len
+        _log.debug("Inserted %d rows into %s", inserted_count, cls.__name__)
+        return inserted_count
+
+    @classmethod
+    def upsert_entries(cls, entries, conflict_fields=('id',), update_fields=None):
+        """
+        Inserts entries, updating the existing row instead whenever one
+        with the same conflict_fields values is already stored
+        (INSERT ... ON CONFLICT DO UPDATE, SQLite 3.24+).
+
+        Args:
+            entries (list): Model instances or dictionaries. An entry's 'id'
+                            is sent along, so rows can be matched by id.
+            conflict_fields (tuple, optional): Fields covered by a UNIQUE
+                                               constraint (or 'id') that
+                                               identify an existing row.
+            update_fields (tuple, optional): Fields overwritten on conflict.
+                                             Defaults to every other field,
+                                             or for dicts every other key
+                                             the dict gives.
+
+        Returns:
+            int: The number of rows inserted or updated. IDs of newly
+                 inserted instances are not back-filled.
+
+        Raises:
+            TypeError: If the input list contains mixed types or invalid types.
+            ValueError: If a field name is not a field of the model.
+            sqlite3.IntegrityError: If another constraint is violated.
+            sqlite3.NotSupportedError: If SQLite is older than 3.24.
+        """
+        is_dict_input = cls._validate_insert_input(entries)
+        if is_dict_input is None:
+            return 0
+        if sqlite3.sqlite_version_info < (3, 24, 0):
+            raise sqlite3.NotSupportedError("upsert_entries requires SQLite 3.24 or newer")
+
+        def db_column(field_name):
+            if field_name == 'id':
+                return 'id'
+            if field_name not in cls._db_column_names:
+                raise ValueError(f"Unknown field for {cls.__name__}: {field_name}")
+            return cls._db_column_names[field_name]
+
+        conflict_columns = [db_column(name) for name in conflict_fields]
+        cls._check_entry_types(entries, is_dict_input)
+        if update_fields is not None:
+            batches = [(entries, [db_column(name) for name in update_fields])]
+        elif is_dict_input:
+            # Only overwrite the columns a dict gives, so a key that is left
+            # out keeps its stored value; dicts are grouped by their keys
+            entries_by_keys = {}
+            for entry in entries:
+                entries_by_keys.setdefault(frozenset(entry), []).append(entry)
+            batches = [
+                (group, [column for field_name, column
+                         in zip(cls._insert_field_names_model, cls._insert_field_names_db)
+                         if field_name in keys and column not in conflict_columns])
+                for keys, group in entries_by_keys.items()]
+        else:
+            batches = [(entries, [column for column in cls._insert_field_names_db
+                                  if column not in conflict_columns])]
+
+        _ensure_db_exists(cls.__name__)
+
+        upserted_count = 0
+        connection_obj = _get_conn()
+        with connection_obj:
+            connection_obj.execute("BEGIN IMMEDIATE")
+            for batch, update_columns in batches:
+                if update_columns:
+                    on_conflict = "DO UPDATE SET " + ", ".join(
+                        f"{column} = excluded.{column}" for column in update_columns)
+                else:
+                    on_conflict = "DO NOTHING"
+                # Same readers as insert_entries, with the id sent as the first column
+                if is_dict_input:
+                    rows = ((entry.get('id'), *cls._row_from_dict(entry)) for entry in batch)
+                else:
+                    rows = ((entry.id, *cls._row_from_instance(entry)) for entry in batch)
+                for _, cursor_obj in cls._execute_insert_chunks(
+                        connection_obj, rows, with_id=True,
+                        suffix=f" ON CONFLICT({', '.join(conflict_columns)}) {on_conflict}"):
+                    upserted_count += cursor_obj.rowcount
+        _log.debug("Upserted %d entries into %s", upserted_count, cls.__name__)
+        return upserted_count
 
     @classmethod
     def delete_entries(cls, conditions=None, confirm_delete_all=False):
@@ -386,6 +934,9 @@ class BaseModel(metaclass=ModelMeta):
         Args:
             conditions (dict, optional): A dictionary of field-value pairs
                                          to filter which rows to delete.
+                                         One key may use the form
+                                         '<column>__in' with a list of values,
+                                         e.g. {'id__in': [1, 2, 3]}.
                                          Defaults to None (delete all).
             confirm_delete_all (bool, optional): Must be set to True to allow
                                                  deleting all entries when
@@ -396,32 +947,52 @@ class BaseModel(metaclass=ModelMeta):
 
         Raises:
             ValueError: If attempting to delete all entries without setting
-                        confirm_delete_all=True.
+                        confirm_delete_all=True, or if more than one '__in'
+                        condition is given.
         """
-        if not os.path.exists(DB_PATH):
-            raise ValueError(f"Database for {cls.__name__} does not exist!")
-
-        connection_obj = sqlite3.connect(DB_PATH)
-        cursor_obj = connection_obj.cursor()
-        cursor_obj.execute("PRAGMA foreign_keys = ON;")
+        _ensure_db_exists(cls.__name__)
 
+        in_keys = []
         if not conditions:
-            if confirm_delete_all or input(f"Are you sure you want to delete ALL records from {cls.__name__}? (yes/no): ").lower() == "yes":
-                query = f"DELETE FROM {cls.__name__.lower()}"
-                cursor_obj.execute(query)
-            else:
-                print("Deletion cancelled.")
-                return
+            if not confirm_delete_all:
+                raise ValueError("confirm_delete_all must be True to delete all rows")
+            query = cls._delete_all_sql
+            values = ()
         else:
+            in_keys = [field for field in conditions if field.endswith("__in")]
+            if len(in_keys) > 1:
+                raise ValueError("delete_entries supports only one '__in' condition")
+            # Sorted keys give one SQL text per filter shape (statement cache hit)
+            condition_keys = sorted(field for field in conditions if field not in in_keys)
             where_clause = " AND ".join(
-                [f"{field} = ?" for field in conditions.keys()])
-            query = f"DELETE FROM {cls.__name__.lower()} WHERE {where_clause}"
-            values = tuple(conditions.values())
-            cursor_obj.execute(query, values)
+                [f"{field} = ?" for field in condition_keys])
+            query = f"DELETE FROM {cls._table_name} WHERE {where_clause}"
+            values = tuple(conditions[field] for field in condition_keys)
 
-        connection_obj.commit()
-        print(f"Deleted entries from {cls.__name__} where {conditions}")
-        connection_obj.close()
+        deleted_count = 0
+        connection_obj = _get_conn()
+        if not in_keys:
+            # A single DELETE is atomic on its own: run it in autocommit
+            # instead of wrapping it in BEGIN/COMMIT. Without a WHERE clause
+            # SQLite can use its truncate optimization when nothing (FKs,
+            # triggers) needs to see the rows one by one.
+            deleted_count = connection_obj.execute(query, values).rowcount
+        else:
+            with connection_obj:
+                connection_obj.execute("BEGIN")
+                # Delete by a list of values, one IN (...) statement per chunk
+                in_column = in_keys[0][:-len("__in")]
+                in_values = list(conditions[in_keys[0]])
+                if condition_keys:
+                    query += " AND "
+                for start in range(0, len(in_values), MAX_IN_PARAMS):
+                    chunk = in_values[start:start + MAX_IN_PARAMS]
+                    placeholders = ", ".join("?" * len(chunk))
+                    deleted_count += connection_obj.execute(
+                        f"{query}{in_column} IN ({placeholders})", values + tuple(chunk)).rowcount
+        _log.debug("Deleted %d entries from %s where %s",
+                   deleted_count, cls.__name__, conditions)
+        return deleted_count
 
     @classmethod
     def replace_entries(cls, conditions, new_values):
@@ -441,30 +1012,30 @@ class BaseModel(metaclass=ModelMeta):
         Raises:
             ValueError: If conditions or new_values are empty or invalid.
         """
-        if not os.path.exists(DB_PATH):
-            raise ValueError(f"Database for {cls.__name__} does not exist!")
-        connection_obj = sqlite3.connect(DB_PATH)
-        cursor_obj = connection_obj.cursor()
-        cursor_obj.execute("PRAGMA foreign_keys = ON;")
+        _ensure_db_exists(cls.__name__)
         if not conditions:
-            print(
-                "Error: You must provide at least one condition to update specific rows.")
+            _log.warning(
+                "You must provide at least one condition to update specific rows.")
             return
         if not new_values:
-            print("Error: No new values provided to update.")
+            _log.warning("No new values provided to update.")
             return
-        set_clause = ", ".join([f"{field} = ?" for field in new_values.keys()])
+        connection_obj = _get_conn()
+        # Sorted keys give one SQL text per update shape (statement cache hit)
+        value_keys = sorted(new_values)
+        condition_keys = sorted(conditions)
+        set_clause = ", ".join([f"{field} = ?" for field in value_keys])
         where_clause = " AND ".join(
-            [f"{field} = ?" for field in conditions.keys()])
-        query = f"UPDATE {cls.__name__.lower()} SET {set_clause} WHERE {where_clause}"
-        values = tuple(new_values.values()) + tuple(conditions.values())
+            [f"{field} = ?" for field in condition_keys])
+        query = f"UPDATE {cls._table_name} SET {set_clause} WHERE {where_clause}"
+        values = (tuple(new_values[field] for field in value_keys)
+                  + tuple(conditions[field] for field in condition_keys))
         try:
-            cursor_obj.execute(query, values)
-            connection_obj.commit()
-            # print(
-            #     f"Updated entries in {cls.__name__} where {conditions} with {new_values}")
+            with connection_obj:
+                connection_obj.execute("BEGIN")
+                connection_obj.execute(query, values)
+            _log.debug("Updated entries in %s where %s with %s",
+                       cls.__name__, conditions, new_values)
         except Exception as e:
-            print(f"Error updating entries: {e}")
+            _log.error("Error updating entries: %s", e)
             raise e
-        finally:
-            connection_obj.close()
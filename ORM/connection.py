@@ -0,0 +1,87 @@
+"""
+Manages the SQLite connections shared by models, querysets and M2M
+managers: one cached connection per thread and database path.
+"""
+import atexit
+import os
+import sqlite3
+import threading
+
+
+DB_PATH = "databases/main.sqlite3"
+
+# Upper bound on bound parameters per IN (...) lookup; older SQLite builds
+# cap SQLITE_MAX_VARIABLE_NUMBER at 999.
+MAX_IN_PARAMS = 500
+
+# Applied once to every connection opened by the ORM. WAL + synchronous=NORMAL
+# avoids an fsync per statement; the rest keeps temp data and hot pages in memory.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-64000;"
+    "PRAGMA mmap_size=30000000000;"
+    "PRAGMA foreign_keys=ON;"
+)
+
+
+# Per-thread cache of open connections keyed by database path
+# (sqlite3 connections cannot be shared across threads by default).
+_local = threading.local()
+
+# Database paths already seen on disk; a database file does not disappear
+# while the ORM uses it, so each path is stat()ed once.
+# close_connections() clears it, since that's the step before deleting a file.
+_existing_db_paths = set()
+
+
+def _connect():
+    """Open a connection to DB_PATH with the tuned PRAGMAs applied."""
+    # Larger statement cache so every INSERT/UPDATE/DELETE shape stays prepared.
+    # isolation_level=None: no implicit BEGIN before DML; every multi-statement
+    # write opens its own transaction with an explicit BEGIN.
+    connection_obj = sqlite3.connect(DB_PATH, cached_statements=256, isolation_level=None)
+    connection_obj.executescript(CONNECTION_PRAGMAS)
+    return connection_obj
+
+
+def _get_conn():
+    """
+    Return this thread's cached connection to DB_PATH, opening it (and
+    applying the PRAGMAs) on first use. The connection stays open across
+    calls; use close_connections() to release it.
+    """
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = {}
+    connection_obj = pool.get(DB_PATH)
+    if connection_obj is None:
+        connection_obj = pool[DB_PATH] = _connect()
+    return connection_obj
+
+
+def _ensure_db_exists(model_name):
+    """Raise ValueError if the database file for `model_name` is missing."""
+    if DB_PATH in _existing_db_paths:
+        return
+    if not os.path.exists(DB_PATH):
+        raise ValueError(f"Database for {model_name} does not exist!")
+    _existing_db_paths.add(DB_PATH)
+
+
+def close_connections():
+    """
+    Close every cached connection held by the current thread.
+    Must be called before deleting or replacing the database file.
+    """
+    _existing_db_paths.clear()
+    pool = getattr(_local, "pool", None)
+    if not pool:
+        return
+    for connection_obj in pool.values():
+        connection_obj.close()
+    pool.clear()
+
+
+atexit.register(close_connections)
@@ -4,32 +4,38 @@ used for model fields and their corresponding SQL representation.
 """
 class Field:
     """Represents a database field."""
-    def __init__(self, db_type, null=True, unique=False, default=None, max_length=None):
+    def __init__(self, db_type, null=True, unique=False, default=None, max_length=None,
+                 index=False):
         """
         Initialize a field.
 
         :param db_type: The database type (e.g., TEXT, INTEGER, DATETIME).
         :param null: If True, the field is nullable. If False, the field is NOT NULL.
+        :param index: If True, create_table adds an index on the column.
         """
         self.db_type = db_type
         self.null = null
         self.unique = unique
         self.default = default
         self.max_length = max_length
+        self.index = index
 
     def get_db_type(self):
         """
         Returns the SQL data type string for this field, including constraints
         like NOT NULL and UNIQUE based on the field's options.
         """
+        # Plain nullable columns (the common case) need no constraint clauses
+        if self.null and not self.unique and self.default is None:
+            return self.db_type
         parts = [self.db_type]
         if not self.null:
             parts.append("NOT NULL")
         # Ensure UNIQUE is checked independently of NULL
         if self.unique: # Changed from potential 'elif' or faulty logic
             parts.append("UNIQUE")
-        # Handle default value if applicable (might be in subclass)
-        if hasattr(self, 'default') and self.default is not None:
+        # __init__ always sets default, so no hasattr probe is needed
+        if self.default is not None:
              # Ensure proper formatting for SQL DEFAULT clause, e.g., strings need quotes
              default_val = self.default
              if isinstance(default_val, str):
@@ -42,41 +48,41 @@ class Field:
 class CharField(Field):
     """Represents a character string field (VARCHAR) in the database."""
     db_type = 'VARCHAR'
-    def __init__(self, null=True, unique=False, default=None, max_length=None):
+    def __init__(self, null=True, unique=False, default=None, max_length=None, index=False):
         """
         Initialize a character field.
 
         :param null: If True, the field is nullable. If False, the field is NOT NULL.
         :param unique: If True, add a UNIQUE constraint.
+        :param index: If True, create_table adds an index on the column.
         """
-        super().__init__("TEXT", null=null, unique=unique)
-        self.default = default
-        self.max_length = max_length
+        super().__init__("TEXT", null=null, unique=unique, default=default,
+                         max_length=max_length, index=index)
 
 
 class IntegerField(Field):
     """Represents an integer field (INTEGER) in the database."""
     db_type = 'INTEGER'
-    def __init__(self, null=True, default=0, unique=False):
+    def __init__(self, null=True, default=0, unique=False, index=False):
         """
         Initialize an integer field.
 
         :param null: If True, the field is nullable. If False, the field is NOT NULL.
         :param default: The default value for the field.
         :param unique: If True, add a UNIQUE constraint.
+        :param index: If True, create_table adds an index on the column.
         """
-        super().__init__("INTEGER", null=null, unique=unique)
-        self.default = default
+        super().__init__("INTEGER", null=null, unique=unique, default=default, index=index)
 
 class DateTimeField(Field):
     """Represents a date/time field (DATETIME) in the database."""
     db_type = 'DATETIME'
-    def __init__(self, null=True, unique=False, default=None):
+    def __init__(self, null=True, unique=False, default=None, index=False):
         """
         Initialize a datetime field.
 
         :param null: If True, the field is nullable. If False, the field is NOT NULL.
         :param unique: If True, add a UNIQUE constraint.
+        :param index: If True, create_table adds an index on the column.
         """
-        super().__init__("DATETIME", null=null, unique=unique)
-        self.default = default
\ No newline at end of file
+        super().__init__("DATETIME", null=null, unique=unique, default=default, index=index)
\ No newline at end of file
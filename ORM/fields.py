@@ -2,12 +2,13 @@
 Defines relationship fields (ForeignKey, OneToOneField, ManyToManyField)
 and the manager for handling ManyToMany relationships.
 """
+import logging
 import sqlite3
 from ORM.datatypes import Field
-from ORM.query import QuerySet
+from ORM.query import QuerySet, rows_to_instances
+from ORM.connection import MAX_IN_PARAMS, _get_conn
 
-
-DB_PATH = "databases/main.sqlite3"
+_log = logging.getLogger(__name__)
 
 # ====================================================
 # 2. Relationship Field Types
@@ -31,35 +32,37 @@ class ManyToManyRelatedManager:
         self.field = field
         self.source_class = instance.__class__
         self.target_class = field.to
-        self.source_class_name = self.source_class.__name__.lower()
-        self.target_class_name = self.target_class.__name__.lower()
-        self.junction_table = field.through or f"{self.source_class_name}_{self.target_class_name}"
+        # Names and SQL are fixed per field; ManyToManyField builds them once
+        self.source_class_name = field.source_name
+        self.target_class_name = field.target_name
+        self.junction_table = field.junction_table
+        # Related objects loaded by ManyToManyField.prefetch(); None if not loaded
+        self._prefetched = None
 
     def _check_instance_saved(self, operation="operate"):
         """Ensure the source instance is saved before performing relationship operations."""
         if self.instance.id is None:
             raise ValueError(f"Cannot {operation} on M2M relationship for an unsaved '{self.source_class_name}' instance.")
 
-    def add(self, *target_objs):
+    def _check_targets(self, target_objs):
+        """Ensure every target is a saved instance of the target model."""
+        for target_obj in target_objs:
+            if not isinstance(target_obj, self.target_class):
+                raise TypeError(f"Can only add '{self.target_class.__name__}' instances.")
+            if target_obj.id is None:
+                raise ValueError(f"Cannot add unsaved '{self.target_class_name}' instance to M2M relationship.")
+
+    def _write_links(self, target_objs, compute_changes):
         """
-        Add one or more target objects to the relationship.
+        Run the junction-table changes returned by `compute_changes(connection)`
+        as (sql, rows) pairs in one BEGIN IMMEDIATE transaction.
         """
-        self._check_instance_saved("add")
-        connection_obj = sqlite3.connect(DB_PATH)
-        cursor_obj = connection_obj.cursor()
-        cursor_obj.execute("PRAGMA foreign_keys = ON;")
+        self._prefetched = None
+        connection_obj = _get_conn()
         try:
-            for target_obj in target_objs:
-                if not isinstance(target_obj, self.target_class):
-                    raise TypeError(f"Can only add '{self.target_class.__name__}' instances.")
-                if target_obj.id is None:
-                    raise ValueError(f"Cannot add unsaved '{self.target_class_name}' instance to M2M relationship.")
-
-                # Use INSERT OR IGNORE to handle potential UNIQUE constraint violations gracefully
-                cursor_obj.execute(f"""
-                    INSERT OR IGNORE INTO {self.junction_table} ({self.source_class_name}_id, {self.target_class_name}_id)
-                    VALUES (?, ?)
-                """, (self.instance.id, target_obj.id))
+            connection_obj.execute("BEGIN IMMEDIATE")
+            for sql, rows in compute_changes(connection_obj):
+                connection_obj.executemany(sql, rows)
             connection_obj.commit()
         except sqlite3.IntegrityError as e:
              # Handle FK constraint violation if target_obj.id doesn't exist in target table
@@ -74,87 +77,100 @@ class ManyToManyRelatedManager:
         except Exception as e:
             connection_obj.rollback()
             raise e
-        finally:
-            connection_obj.close()
+
+    def add(self, *target_objs):
+        """
+        Add one or more target objects to the relationship.
+        """
+        if not target_objs:
+            return  # Nothing to link: skip the transaction entirely
+        self._check_instance_saved("add")
+        # Validate every target before touching the database
+        self._check_targets(target_objs)
+        rows = [(self.instance.id, target_obj.id) for target_obj in target_objs]
+        # One executemany for all targets; INSERT OR IGNORE handles
+        # potential UNIQUE constraint violations gracefully
+        self._write_links(target_objs, lambda connection_obj: [(self.field.sql_add, rows)])
 
     def remove(self, *target_objs):
         """
         Remove one or more target objects from the relationship.
         """
+        if not target_objs:
+            return  # Nothing to unlink: skip the transaction entirely
         self._check_instance_saved("remove")
-        connection_obj = sqlite3.connect(DB_PATH)
-        cursor_obj = connection_obj.cursor()
-        cursor_obj.execute("PRAGMA foreign_keys = ON;")
+        rows = []
+        for target_obj in target_objs:
+            if not isinstance(target_obj, self.target_class):
+                raise TypeError(f"Can only remove '{self.target_class.__name__}' instances.")
+            # Unsaved targets (no ID) can't have a row to remove: skip them
+            if target_obj.id is not None:
+                rows.append((self.instance.id, target_obj.id))
+        if len(rows) < len(target_objs):
+            # Logged once per call rather than once per skipped target
+            _log.debug("Skipped %d unsaved '%s' instance(s) in M2M remove().",
+                       len(target_objs) - len(rows), self.target_class_name)
+        if not rows:
+            return
+
+        self._prefetched = None
+        connection_obj = _get_conn()
         try:
-            for target_obj in target_objs:
-                if not isinstance(target_obj, self.target_class):
-                    raise TypeError(f"Can only remove '{self.target_class.__name__}' instances.")
-                if target_obj.id is None:
-                     # Cannot remove relationship if target ID is unknown
-                     print(f"Warning: Cannot remove M2M relationship for unsaved '{self.target_class_name}' instance.")
-                     continue
-
-                cursor_obj.execute(f"""
-                    DELETE FROM {self.junction_table}
-                    WHERE {self.source_class_name}_id = ? AND {self.target_class_name}_id = ?
-                """, (self.instance.id, target_obj.id))
+            connection_obj.execute("BEGIN IMMEDIATE")
+            connection_obj.executemany(self.field.sql_remove, rows)
             connection_obj.commit()
         except Exception as e:
             connection_obj.rollback()
             raise e
-        finally:
-            connection_obj.close()
 
     def clear(self):
         """Remove all relationships for this instance."""
         self._check_instance_saved("clear")
-        connection_obj = sqlite3.connect(DB_PATH)
-        cursor_obj = connection_obj.cursor()
-        cursor_obj.execute("PRAGMA foreign_keys = ON;")
+        self._prefetched = None
+        connection_obj = _get_conn()
         try:
-            cursor_obj.execute(f"""
-                DELETE FROM {self.junction_table}
-                WHERE {self.source_class_name}_id = ?
-            """, (self.instance.id,))
+            connection_obj.execute(self.field.sql_clear, (self.instance.id,))
             connection_obj.commit()
         except Exception as e:
             connection_obj.rollback()
             raise e
-        finally:
-            connection_obj.close()
 
     def set(self, target_objs):
         """
         Replace the current set of related objects with the provided ones.
         """
         self._check_instance_saved("set")
-        self.clear()
-        if target_objs: # Only add if there are objects to add
-            self.add(*target_objs)
+        target_objs = list(target_objs)
+        if not target_objs:
+            self.clear()  # One DELETE; no need to read the current links
+            return
+        self._check_targets(target_objs)
+        source_id = self.instance.id
+        wanted = {target_obj.id for target_obj in target_objs}
+
+        def compute_changes(connection_obj):
+            # Diff against the current links so only the changes are written
+            existing = {row[0] for row in connection_obj.execute(self.field.sql_target_ids, (source_id,))}
+            return [
+                (self.field.sql_remove, [(source_id, target_id) for target_id in sorted(existing - wanted)]),
+                (self.field.sql_add, [(source_id, target_id) for target_id in sorted(wanted - existing)]),
+            ]
+
+        self._write_links(target_objs, compute_changes)
 
     def all(self):
         """
         Retrieve all related target objects as a QuerySet.
         """
         self._check_instance_saved("retrieve")
-        # Construct a QuerySet for the target model, filtered by the junction table
-        target_ids_query = f"""
-            SELECT {self.target_class_name}_id
-            FROM {self.junction_table}
-            WHERE {self.source_class_name}_id = ?
-        """
-        connection_obj = sqlite3.connect(DB_PATH)
-        cursor_obj = connection_obj.cursor()
-        cursor_obj.execute(target_ids_query, (self.instance.id,))
-        target_ids = [row[0] for row in cursor_obj.fetchall()]
-        connection_obj.close()
-
-        if not target_ids:
-            # Return an empty QuerySet if no related objects
-            return QuerySet(self.target_class).filter(id__in=[]) # Filter with empty list
-
-        # Use the 'id__in' filter on the target model's manager
-        return QuerySet(self.target_class).filter(id__in=target_ids)
+        # Filter the target model through the junction table in a subquery, so
+        # the QuerySet fetches related rows in one query (and stays lazy)
+        queryset = QuerySet(self.target_class, where_clause=self.field.sql_target_filter,
+                            parameters=[self.instance.id])
+        # Reuse the rows loaded by ManyToManyField.prefetch(); filter(),
+        # slicing, etc. build new QuerySets and still query the database
+        queryset._result_cache = self._prefetched
+        return queryset
 
     def filter(self, **kwargs):
         """Filter the set of related objects."""
@@ -204,6 +220,70 @@ class ManyToManyField(Field):
     def __set_name__(self, owner, name):
         """Called when the field is assigned to a model class attribute."""
         self.name = name # Store the attribute name (e.g., 'courses')
+        # Slot (added by ModelMeta) that caches each instance's manager
+        self.manager_attr = f"_{name}_manager"
+
+    def bind_source(self, source_name):
+        """
+        Called by ModelMeta with the owning model's table name. Table and
+        column names are class-level constants, so the managers' SQL is
+        built here once instead of on every add/remove/clear/all.
+        """
+        self.source_name = source_name
+        self.target_name = self.to.__name__.lower()
+        self.junction_table = self.through or f"{self.source_name}_{self.target_name}"
+        source_column = f"{self.source_name}_id"
+        target_column = f"{self.target_name}_id"
+        self.sql_add = (f"INSERT OR IGNORE INTO {self.junction_table} "
+                        f"({source_column}, {target_column}) VALUES (?, ?)")
+        self.sql_remove = (f"DELETE FROM {self.junction_table} "
+                           f"WHERE {source_column} = ? AND {target_column} = ?")
+        self.sql_clear = f"DELETE FROM {self.junction_table} WHERE {source_column} = ?"
+        self.sql_target_ids = (f"SELECT {target_column} FROM {self.junction_table} "
+                               f"WHERE {source_column} = ?")
+        self.sql_target_filter = f"id IN ({self.sql_target_ids})"
+        # Related rows for a batch of sources, tagged with their source id
+        self.sql_prefetch = (f"SELECT {self.junction_table}.{source_column} AS __source_id, "
+                             f"{self.target_name}.* FROM {self.target_name} "
+                             f"JOIN {self.junction_table} "
+                             f"ON {self.target_name}.id = {self.junction_table}.{target_column} "
+                             f"WHERE {self.junction_table}.{source_column} IN ")
+
+    def prefetch(self, source_instances):
+        """
+        Load the related objects of many source instances at once, so
+        iterating over them doesn't run one query per instance.
+
+        Runs one JOIN query per MAX_IN_PARAMS saved instances and caches
+        each instance's related objects on its manager; the next
+        instance.<field>.all() returns them without querying. Adding,
+        removing, clearing or setting relations through the manager, or
+        linking through bulk_link_m2m, drops the cache. Otherwise it is a
+        snapshot: delete_entries, replace_entries and raw SQL writes do not
+        refresh it, so prefetch again after those.
+
+        Usage:
+            Book.authors.prefetch(books)
+        """
+        source_instances = [instance for instance in source_instances
+                            if instance.id is not None]
+        source_ids = list(dict.fromkeys(instance.id for instance in source_instances))
+        related = {source_id: [] for source_id in source_ids}
+        cursor_obj = _get_conn().cursor()
+        # Set row_factory on this cursor only; the connection is shared
+        cursor_obj.row_factory = sqlite3.Row
+        for start in range(0, len(source_ids), MAX_IN_PARAMS):
+            chunk = source_ids[start:start + MAX_IN_PARAMS]
+            cursor_obj.execute(
+                f"{self.sql_prefetch}({', '.join('?' * len(chunk))}) ORDER BY {self.target_name}.id",
+                chunk)
+            for row in cursor_obj.fetchall():
+                row_dict = dict(row)
+                related[row_dict.pop("__source_id")].append(row_dict)
+
+        for instance in source_instances:
+            manager = self.__get__(instance, type(instance))
+            manager._prefetched = rows_to_instances(self.to, related[instance.id])
 
     def __get__(self, instance, owner):
         """
@@ -214,13 +294,13 @@ class ManyToManyField(Field):
             # For now, let's return self or raise error, as instance access is primary goal.
             return self # Or raise AttributeError("M2M field can only be accessed via an instance")
 
-        # Check if a manager instance is already cached on the instance
-        # Use a private attribute name based on the field name
-        manager_attr = f"_{self.name}_manager"
-        if not hasattr(instance, manager_attr):
-            # Create and cache the manager instance
-            setattr(instance, manager_attr, ManyToManyRelatedManager(instance, self))
-        return getattr(instance, manager_attr)
+        # Return the manager cached on the instance, creating it on first access
+        try:
+            return getattr(instance, self.manager_attr)
+        except AttributeError:
+            manager = ManyToManyRelatedManager(instance, self)
+            setattr(instance, self.manager_attr, manager)
+            return manager
 
 
 class ForeignKey(Field):
@@ -6,13 +6,43 @@ import sqlite3
 import os
 import sys
 import importlib
-import inspect
+import json
+import re
 import argparse
 from pathlib import Path
 
 from ORM.base import BaseModel, DB_PATH
 
 
+# Migration files are named "<4-digit number>_<name>.py"
+MIGRATION_FILE_RE = re.compile(r"\d{4}_.*\.py")
+
+
+def migration_files(migrations_dir):
+    """Return the migration files in `migrations_dir`, sorted by name."""
+    # One scandir pass and a precompiled pattern instead of Path.glob
+    with os.scandir(migrations_dir) as entries:
+        names = sorted(entry.name for entry in entries
+                       if MIGRATION_FILE_RE.fullmatch(entry.name))
+    return [migrations_dir / name for name in names]
+
+
+def _iter_model_files(path):
+    """
+    Yield the paths of the model source files under `path`, skipping
+    dunder files (e.g. __init__.py) and dunder or hidden directories
+    (e.g. __pycache__, .git) without descending into them.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith(('__', '.')):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_model_files(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file():
+                yield entry.path
+
+
 def find_models(project_root, models_folder='myapp'):
     """Find all model classes in the specified folder that inherit from BaseModel."""
     models = []
@@ -27,39 +57,38 @@ def find_models(project_root, models_folder='myapp'):
         return models
 
     # Walk only through the models folder
-    for root, dirs, files in os.walk(models_path):
-        for file in files:
-            if file.endswith('.py') and not file.startswith('__'):
-                file_path = os.path.join(root, file)
-                module_path = os.path.relpath(file_path, project_root).replace(
-                    '/', '.').replace('\\', '.')[:-3]
-
-                print(f"Examining {file_path} -> module path: {module_path}")
-
-                try:
-                    # Import the module
-                    module = importlib.import_module(module_path)
-
-                    # Find model classes in the module
-                    classes_found = False
-                    for name, obj in inspect.getmembers(module):
-                        if (
-                            inspect.isclass(obj)
-                            and issubclass(obj, BaseModel)
-                            and obj != BaseModel
-                            and obj.__module__ == module.__name__ 
-                        ):
-                            print(f"  --> {name} is a model!")
-                            models.append(obj)
-                            classes_found = True
-
-                    if not classes_found:
-                        print(f"  No model classes found in {file_path}")
-
-                except (ImportError, ModuleNotFoundError) as e:
-                    print(f"  Error importing {module_path}: {e}")
-                except Exception as e:
-                    print(f"  Unexpected error with {module_path}: {e}")
+    for file_path in _iter_model_files(models_path):
+        module_path = os.path.relpath(file_path, project_root).replace(
+            '/', '.').replace('\\', '.')[:-3]
+
+        print(f"Examining {file_path} -> module path: {module_path}")
+
+        try:
+            # Import the module
+            module = importlib.import_module(module_path)
+
+            # Find model classes in the module. vars() keeps definition
+            # order (so related models come first) and, unlike
+            # inspect.getmembers, doesn't sort or getattr every member.
+            classes_found = False
+            for name, obj in vars(module).items():
+                if (
+                    isinstance(obj, type)
+                    and issubclass(obj, BaseModel)
+                    and obj != BaseModel
+                    and obj.__module__ == module.__name__ 
+                ):
+                    print(f"  --> {name} is a model!")
+                    models.append(obj)
+                    classes_found = True
+
+            if not classes_found:
+                print(f"  No model classes found in {file_path}")
+
+        except (ImportError, ModuleNotFoundError) as e:
+            print(f"  Error importing {module_path}: {e}")
+        except Exception as e:
+            print(f"  Unexpected error with {module_path}: {e}")
 
     return models
 
@@ -73,18 +102,19 @@ def generate_migrations(models):
     migrations_dir.mkdir(exist_ok=True)
 
     # Get the next migration number
-    existing_migrations = [f for f in migrations_dir.glob('????_*.py')]
+    existing_migrations = migration_files(migrations_dir)
     next_number = 1
     if existing_migrations:
-        latest = max(existing_migrations)
+        latest = existing_migrations[-1]
         next_number = int(latest.name[:4]) + 1
 
     # Enhanced model change detection
     from hashlib import sha256
 
-    # Create detailed signatures that include field information
-    model_signatures = {}
-    for model in models:
+    # Create detailed signatures that include field information, fed in a
+    # fixed model order into a single hash
+    signature_hash = sha256()
+    for model in sorted(models, key=lambda m: (m.__module__, m.__name__)):
         # Capture basic model info
         model_info = f"{model.__name__}:{model.__module__}"
 
@@ -99,13 +129,16 @@ def generate_migrations(models):
             for attr_name in ['db_type', 'null', 'unique', 'default']:
                 if hasattr(field, attr_name):
                     attrs[attr_name] = getattr(field, attr_name)
+            # Only indexed fields record it, keeping other signatures short
+            if getattr(field, 'index', False):
+                attrs['index'] = True
 
             # For foreign key fields, include target model
             if hasattr(field, 'to'):
                 attrs['to'] = field.to.__name__
 
             # Create field signature
-            field_signature = f"{field_name}:{field_type}:{attrs}"
+            field_signature = f"{field_name}:{field_type}:{json.dumps(attrs, sort_keys=True, default=str)}"
             fields_info.append(field_signature)
 
         # Add many-to-many fields if present
@@ -118,26 +151,23 @@ def generate_migrations(models):
                 if field.through:
                     attrs['through'] = field.through
 
-                field_signature = f"{field_name}:{field_type}:{attrs}"
+                field_signature = f"{field_name}:{field_type}:{json.dumps(attrs, sort_keys=True)}"
                 fields_info.append(field_signature)
 
         # Create complete model signature
-        model_signature = f"{model_info}:{','.join(sorted(fields_info))}"
-        model_signatures[model.__name__] = sha256(
-            model_signature.encode()).hexdigest()
+        model_signature = f"{model_info}:{','.join(sorted(fields_info))}\n"
+        signature_hash.update(model_signature.encode())
+    current_signature = signature_hash.hexdigest()
 
     # Load the last migration's signature if it exists
     signature_file = migrations_dir / 'last_signature.txt'
     if signature_file.exists():
         with open(signature_file, 'r') as f:
             last_signature = f.read().strip()
-        current_signature = sha256(str(model_signatures).encode()).hexdigest()
 
         if last_signature == current_signature:
             print("No changes detected in models. Skipping migration generation.")
             return
-    else:
-        current_signature = sha256(str(model_signatures).encode()).hexdigest()
 
     # Create a migration file with timestamp and sequential number
     from datetime import datetime
@@ -222,8 +252,10 @@ def apply_migrations(specific_migration=None):
     create_migrations_table()
 
     # Get list of applied migrations
-    applied_migrations = get_applied_migrations()
-    print(f"Already applied migrations: {', '.join(applied_migrations) if applied_migrations else 'None'}")
+    applied_in_order = get_applied_migrations()
+    print(f"Already applied migrations: {', '.join(applied_in_order) if applied_in_order else 'None'}")
+    # Set for O(1) "already applied?" checks
+    applied_migrations = set(applied_in_order)
 
     migrations_dir = Path('migrations')
     if not migrations_dir.exists():
@@ -231,8 +263,8 @@ def apply_migrations(specific_migration=None):
         return
 
     # Get all migration files in sorted order
-    migration_files = sorted(migrations_dir.glob('????_*.py'))
-    if not migration_files:
+    found_files = migration_files(migrations_dir)
+    if not found_files:
         print("No migration files found. Run 'generate' first.")
         return
 
@@ -240,7 +272,7 @@ def apply_migrations(specific_migration=None):
 
     # If applying a specific migration
     if specific_migration:
-        migration_file = next((f for f in migration_files if f.stem == specific_migration), None)
+        migration_file = next((f for f in found_files if f.stem == specific_migration), None)
         if not migration_file:
             print(f"Migration '{specific_migration}' not found.")
             return
@@ -263,7 +295,7 @@ def apply_migrations(specific_migration=None):
         return
 
     # Apply all migrations in sequence
-    for migration_file in migration_files:
+    for migration_file in found_files:
         module_name = migration_file.stem
 
         # Skip if already applied
@@ -285,21 +317,21 @@ def apply_migrations(specific_migration=None):
 
 def show_migrations():
     """Display migration status - which are applied and which are pending."""
-    applied_migrations = get_applied_migrations()
+    applied_migrations = set(get_applied_migrations())
 
     migrations_dir = Path('migrations')
     if not migrations_dir.exists():
         print("No migrations directory found.")
         return
 
-    migration_files = sorted(migrations_dir.glob('????_*.py'))
-    if not migration_files:
+    found_files = migration_files(migrations_dir)
+    if not found_files:
         print("No migration files found.")
         return
 
     print("\nMigration status:")
     print("-" * 50)
-    for migration_file in migration_files:
+    for migration_file in found_files:
         name = migration_file.stem
         status = "[X]" if name in applied_migrations else "[ ]"
         print(f"{status} {name}")
@@ -4,11 +4,32 @@ and executing database queries based on model interactions.
 """
 import sqlite3
 import re
+from ORM.connection import _get_conn
 
 
-DB_PATH = "databases/main.sqlite3"
 REPR_OUTPUT_SIZE = 10
 
+
+def rows_to_instances(model, results_as_dicts):
+    """
+    Convert row dictionaries to instances of `model`.
+    __init__ already sets 'id', regular fields and 'fieldname_id' columns;
+    only columns outside the model (e.g. added by a migration) need setting
+    afterwards.
+    """
+    extra_columns = ()
+    if results_as_dicts:
+        extra_columns = [column_name for column_name in results_as_dicts[0]
+                         if column_name not in model._init_attr_names]
+    instances = []
+    for row_dict in results_as_dicts:
+        instance = model(**row_dict)
+        for column_name in extra_columns:
+            setattr(instance, column_name, row_dict[column_name])
+        instances.append(instance)
+    return instances
+
+
 class QuerySet:
     """
     A QuerySet represents a collection of database queries for a specific model.
@@ -30,6 +51,7 @@ class QuerySet:
         limit(limit_val): Limits the number of results returned.
         offset(offset_val): Specifies the number of results to skip.
         all(): Executes the query and returns all results.
+        as_dicts(): Executes the query and returns all results as dictionaries.
         __iter__(): Allows iteration over the results.
         __getitem__(index): Retrieves a specific result or slice of results.
 
@@ -76,6 +98,8 @@ class QuerySet:
         self.order_clause = order_clause
         self.limit_val = limit_val
         self.offset_val = offset_val
+        # Instances already loaded for this exact query (set by M2M prefetch)
+        self._result_cache = None
 
     def _fetch_for_repr(self):
         """Fetch a limited number of results for representation."""
@@ -137,30 +161,17 @@ class QuerySet:
         Executes the constructed SQL query and returns the results
         as a list of model instances.
         """
+        if self._result_cache is not None:
+            return list(self._result_cache)
         query = self._build_query()
-        connection_obj = sqlite3.connect(DB_PATH)
-        connection_obj.execute("PRAGMA foreign_keys = ON;")
-        # Set row_factory to create dictionaries directly
-        connection_obj.row_factory = sqlite3.Row
-        cursor_obj = connection_obj.cursor()
+        cursor_obj = _get_conn().cursor()
+        # Set row_factory on this cursor only; the connection is shared
+        cursor_obj.row_factory = sqlite3.Row
         cursor_obj.execute(query, tuple(self.parameters))
 
         # Fetch rows as dictionaries
         results_as_dicts = [dict(row) for row in cursor_obj.fetchall()]
-        connection_obj.close()
-
-        # Convert dictionaries to model instances
-        instances = []
-        for row_dict in results_as_dicts:
-            instance = self.model(**row_dict)
-            for column_name, value in row_dict.items():
-                # Directly set the attribute on the instance.
-                # This handles 'id', regular fields, and 'fieldname_id' columns.
-                setattr(instance, column_name, value)
-                
-            instances.append(instance)
-
-        return instances
+        return rows_to_instances(self.model, results_as_dicts)
 
     def sanitize_field_name(self, field_name):
         """
@@ -321,6 +332,15 @@ class QuerySet:
         # _execute now returns instances
         return self._execute()
 
+    def as_dicts(self):
+        """
+        Executes the query and returns every result as a dictionary, like
+        calling as_dict() on each instance. M2M ids are loaded for the whole
+        result set at once (see BaseModel.bulk_as_dict) rather than with one
+        query per instance.
+        """
+        return self.model.bulk_as_dict(self._execute())
+
     def __iter__(self):
         """
         Allows iteration over the results (model instances).
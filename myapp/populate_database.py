@@ -101,8 +101,8 @@ def run_demo():
 
     # 9. Cleanup
     print("\n--- Cleaning up: Deleting all students and courses ---")
-    Student.delete_entries({})
-    Course.delete_entries({})
+    Student.delete_entries({}, confirm_delete_all=True)
+    Course.delete_entries({}, confirm_delete_all=True)
     print("All students and courses deleted.")
     wait()
 
@@ -105,6 +105,52 @@ class TestCreateTable(unittest.TestCase):
 
         connection.close()
 
+    def test_create_table_keeps_data_when_schema_unchanged(self):
+        """Test that create_table is a no-op when the model schema has not changed."""
+        Student.create_table()
+        self.assertEqual(len(Student.objects.all()), 2)
+
+    def test_create_table_rebuilds_changed_schema(self):
+        """Test that create_table drops and recreates the table when the schema changes."""
+        class Gadget(base.BaseModel):
+            name = datatypes.CharField()
+        Gadget.create_table()
+        Gadget.insert_entries([{"name": "Old"}])
+
+        class Gadget(base.BaseModel):  # Same table, new column
+            name = datatypes.CharField()
+            colour = datatypes.CharField()
+        Gadget.create_table()
+        self.assertEqual(len(Gadget.objects.all()), 0)
+        Gadget.insert_entries([{"name": "New", "colour": "Red"}])
+        self.assertEqual(Gadget.objects.get(name="New").colour, "Red")
+
+        # force=True rebuilds even though the schema is unchanged
+        Gadget.create_table(force=True)
+        self.assertEqual(len(Gadget.objects.all()), 0)
+
+    def test_force_create_table_keeps_child_rows(self):
+        """Test create_table(force=True) resets only the model's own table."""
+        Department.create_table(force=True)
+        self.assertEqual(len(Department.objects.all()), 0)
+        self.assertEqual(len(Student.objects.all()), 2)
+
+    def test_rebuild_keeps_rows_referencing_the_table(self):
+        """Test rebuilding a parent table doesn't cascade-delete its child rows."""
+        connection = sqlite3.connect(DB_PATH)
+        try:
+            # Force a rebuild of the populated department table
+            connection.execute("UPDATE __orm_schema__ SET hash = 'stale' WHERE name = 'department'")
+            connection.commit()
+        finally:
+            connection.close()
+        Department.create_table()
+
+        self.assertEqual(len(Student.objects.all()), 2)
+        self.assertIsNotNone(Student.objects.get(name="Yehor Boiar").department_id)
+        # Foreign keys are enforced again after the rebuild
+        self.assertEqual(base._get_conn().execute("PRAGMA foreign_keys").fetchone()[0], 1)
+
     def test_populate_schema(self):
         # This test now verifies the data inserted by setUp
         connection = sqlite3.connect(DB_PATH)
@@ -353,6 +399,16 @@ class TestCreateTable(unittest.TestCase):
         self.assertEqual(student.name, "Test")
         self.assertFalse(hasattr(student, "non_existent_field"))
 
+    def test_fields_stored_in_slots(self):
+        """Test model fields live in slots, leaving the instance __dict__ empty."""
+        self.assertIn("name", Student.__slots__)
+        self.assertIn("department_id", Student.__slots__)
+        student = Student.objects.get(id=self.student1.id)
+        self.assertEqual(student.department_id, self.dept1.id)
+        self.assertDictEqual(vars(student), {})
+        student.extra = "allowed"  # Attributes outside the schema still work
+        self.assertIn("extra='allowed'", repr(student))
+
     def test_init_missing_fields(self):
         """Test initializing with missing fields defaults them to None"""
         # Student has 'name', 'degree', 'department'
@@ -363,6 +419,21 @@ class TestCreateTable(unittest.TestCase):
         self.assertIsNone(getattr(student, 'degree', 'Attribute missing')) # Default to None
         self.assertTrue(hasattr(student, 'department'))
         self.assertIsNone(getattr(student, 'department', 'Attribute missing')) # Default to None
+        self.assertIsNone(student.department_id)
+
+    def test_init_fk_id_column(self):
+        """Test the FK *_id column can be passed to __init__, as QuerySet rows do"""
+        student = Student(id=7, name="Id Only", department_id=self.dept1.id)
+        self.assertEqual(student.id, 7)
+        self.assertEqual(student.department_id, self.dept1.id)
+        self.assertEqual(student.as_dict()['department_id'], self.dept1.id)
+
+    def test_insert_instance_with_dict_fk(self):
+        """Test an instance holding an {'id': ...} FK value is inserted with that id"""
+        student = Student(name="Dict FK", degree="Math", department={'id': self.dept1.id})
+        Student.insert_entries([student])
+        stored = Student.objects.filter(name="Dict FK")[0]
+        self.assertEqual(stored.department_id, self.dept1.id)
 
     def test_as_dict_fk_none(self):
         """Test as_dict when a ForeignKey field is None"""
@@ -377,6 +448,16 @@ class TestCreateTable(unittest.TestCase):
         }
         self.assertDictEqual(student_dict, expected)
 
+    def test_model_instance_binds_as_id(self):
+        """Test a model instance can be passed directly as a query parameter."""
+        connection = sqlite3.connect(DB_PATH)
+        try:
+            count = connection.execute(
+                "SELECT COUNT(*) FROM student WHERE department_id = ?", (self.dept1,)).fetchone()[0]
+        finally:
+            connection.close()
+        self.assertEqual(count, 2)
+
     def test_insert_empty_list(self):
         """Test insert_entries with an empty list"""
         # Should execute without error and print "No entries..."
@@ -412,12 +493,154 @@ class TestCreateTable(unittest.TestCase):
         """Test insert_entries with a connection error (lines 246-248)."""
         # Configure the mock connection to raise an error
         mock_connect.side_effect = sqlite3.OperationalError("Cannot connect")
+        # Drop the cached connection so insert_entries has to open a new one
+        base.close_connections()
 
         student_new = Student(name="Connect Fail", degree="Test")
         with self.assertRaises(sqlite3.OperationalError):
             Student.insert_entries([student_new])
         # Verify rollback wasn't attempted (since connection failed) - tricky without more mocks
 
+    def test_connection_is_reused(self):
+        """Test that CRUD calls share one cached connection until it is closed."""
+        connection = base._get_conn()
+        self.assertIsNone(connection.isolation_level)  # Explicit BEGIN/COMMIT only
+        self.assertFalse(connection.in_transaction)
+        Student.replace_entries({"id": self.student1.id}, {"degree": "Reused"})
+        self.assertIs(base._get_conn(), connection)
+        base.close_connections()
+        self.assertIsNot(base._get_conn(), connection)
+
+    def test_insert_sql_cached_on_class(self):
+        """Test that the INSERT statement is built once by the metaclass."""
+        self.assertEqual(
+            Student._insert_sql,
+            "INSERT INTO student (name, degree, department_id) VALUES (?, ?, ?)")
+        self.assertEqual(Student._insert_field_names_model, ['name', 'degree', 'department'])
+        self.assertEqual(Student._insert_field_names_db, ['name', 'degree', 'department_id'])
+
+    def test_insert_instances_assigns_ids_across_statements(self):
+        """Test instance ids are back-filled when the batch spans several multi-row INSERTs."""
+        students = [Student(name=f"Batch {i}", degree="Batch") for i in range(5)]
+        with patch('ORM.base.MAX_INSERT_PARAMS', 6):  # 2 rows per statement
+            Student.insert_entries(students)
+        for student in students:
+            self.assertEqual(Student.objects.get(id=student.id).name, student.name)
+
+    def test_insert_dicts_across_statements(self):
+        """Test dict entries are inserted in chunks, reusing the cached multi-row SQL."""
+        rows = [{"name": f"Dict {i}", "degree": "Batch"} for i in range(5)]
+        with patch('ORM.base.MAX_INSERT_PARAMS', 6):  # 2 rows per statement
+            Student.insert_entries(rows)
+        self.assertEqual(len(Student.objects.filter(degree="Batch")), 5)
+        self.assertIs(Student._multi_row_insert_sql(2), Student._multi_row_insert_sql(2))
+
+    def test_insert_columns(self):
+        """Test column-wise bulk insert, including FK resolution and NULL defaults."""
+        inserted = Student.insert_columns({
+            "name": ["Col A", "Col B"],
+            "degree": ["Maths", "Physics"],
+            "department": [self.dept1, self.dept1.id],
+        })
+        self.assertEqual(inserted, 2)
+        col_a = Student.objects.get(name="Col A")
+        self.assertEqual(col_a.degree, "Maths")
+        self.assertEqual(col_a.department_id, self.dept1.id)
+        self.assertEqual(Student.objects.get(name="Col B").department_id, self.dept1.id)
+
+        Student.insert_columns({"name": ["No Dept"], "degree": ["Art"]})
+        self.assertIsNone(Student.objects.get(name="No Dept").department_id)
+
+    def test_insert_columns_invalid_input(self):
+        """Test insert_columns rejects unknown fields and ragged columns."""
+        with self.assertRaisesRegex(ValueError, "Unknown fields for Student: age"):
+            Student.insert_columns({"name": ["X"], "age": [1]})
+        with self.assertRaisesRegex(ValueError, "same length"):
+            Student.insert_columns({"name": ["X", "Y"], "degree": ["Z"]})
+        self.assertEqual(Student.insert_columns({}), 0)
+
+    def test_delete_all_requires_confirmation(self):
+        """Test delete_entries without conditions refuses to run unless confirmed."""
+        with self.assertRaisesRegex(ValueError, "confirm_delete_all must be True"):
+            Student.delete_entries()
+        self.assertEqual(len(Student.objects.all()), 2)
+
+    def test_delete_entries_in_list(self):
+        """Test delete_entries with an '__in' list, chunked across several statements."""
+        extra = [Student(name=f"Extra {i}", degree="Extra") for i in range(5)]
+        Student.insert_entries(extra)
+        with patch('ORM.base.MAX_IN_PARAMS', 2):
+            deleted = Student.delete_entries(
+                {"degree": "Extra", "id__in": [s.id for s in extra[:3]] + [self.student1.id]})
+        self.assertEqual(deleted, 3)  # student1 does not match degree="Extra"
+        self.assertEqual(len(Student.objects.filter(degree="Extra")), 2)
+        with self.assertRaisesRegex(ValueError, "only one '__in' condition"):
+            Student.delete_entries({"id__in": [1], "name__in": ["x"]})
+
+    def test_fk_column_indexed(self):
+        """Test create_table adds an index on FK columns."""
+        connection = sqlite3.connect(DB_PATH)
+        try:
+            indexed = [row[0] for row in connection.execute(
+                "SELECT info.name FROM pragma_index_list('student') AS list "
+                "JOIN pragma_index_info(list.name) AS info").fetchall()]
+        finally:
+            connection.close()
+        self.assertIn("department_id", indexed)
+
+    def test_index_field_indexed(self):
+        """Test create_table adds an index on index=True fields only."""
+        class Gadget(base.BaseModel):
+            name = datatypes.CharField(index=True)
+            colour = datatypes.CharField()
+        Gadget.create_table()
+        connection = sqlite3.connect(DB_PATH)
+        try:
+            indexed = [row[0] for row in connection.execute(
+                "SELECT info.name FROM pragma_index_list('gadget') AS list "
+                "JOIN pragma_index_info(list.name) AS info").fetchall()]
+        finally:
+            connection.close()
+        self.assertEqual(indexed, ["name"])
+
+    def test_upsert_entries(self):
+        """Test upsert_entries updates rows matched by a unique field and inserts the rest."""
+        count = Student.upsert_entries([
+            {"name": "Yehor Boiar", "degree": "Maths", "department": self.dept1},
+            {"name": "New Student", "degree": "Physics"},
+        ], conflict_fields=("name",))
+        self.assertEqual(count, 2)
+        self.assertEqual(Student.objects.get(name="Yehor Boiar").degree, "Maths")
+        self.assertEqual(Student.objects.get(name="Yehor Boiar").id, self.student1.id)
+        self.assertEqual(len(Student.objects.all()), 3)
+
+        # Match by id, only overwriting the listed fields
+        self.student2.name = "Renamed"
+        self.student2.degree = "Ignored"
+        Student.upsert_entries([self.student2], update_fields=("name",))
+        renamed = Student.objects.get(id=self.student2.id)
+        self.assertEqual((renamed.name, renamed.degree), ("Renamed", "Computer Science"))
+
+        with self.assertRaisesRegex(ValueError, "Unknown field"):
+            Student.upsert_entries([{"name": "x"}], conflict_fields=("nope",))
+
+    def test_upsert_keeps_fk_of_loaded_instance(self):
+        """Test upserting an instance loaded from the database keeps its FK column."""
+        loaded = Student.objects.get(id=self.student1.id)
+        self.assertIsNone(loaded.department)  # Only department_id is loaded
+        loaded.name = "Loaded And Renamed"
+        Student.upsert_entries([loaded])
+        stored = Student.objects.get(id=self.student1.id)
+        self.assertEqual(stored.name, "Loaded And Renamed")
+        self.assertEqual(stored.department_id, self.dept1.id)
+
+        # Keys left out of a dict keep their stored values
+        Student.upsert_entries([{"id": self.student1.id, "name": "Dict Renamed",
+                                 "degree": "Maths"}])
+        stored = Student.objects.get(id=self.student1.id)
+        self.assertEqual((stored.name, stored.degree, stored.department_id),
+                         ("Dict Renamed", "Maths", self.dept1.id))
+
     def test_replace_no_conditions(self):
         """Test replace_entries with no conditions (lines 288-289)."""
         # Should run without error and print "Error: You must provide..."
@@ -452,6 +675,7 @@ class TestCreateTable(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Clean up the database after tests."""
+        base.close_connections()
         if os.path.exists(DB_PATH):
             os.remove(DB_PATH)
         if os.path.exists('databases'):
@@ -94,6 +94,7 @@ class TestOneToManyRelationship(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Clean up the database after tests."""
+        base.close_connections()
         if os.path.exists(DB_PATH):
             os.remove(DB_PATH)
         if os.path.exists('databases'):
@@ -267,7 +268,7 @@ class TestOneToOneRelationshipEdgeCases(unittest.TestCase):
         self.assertDictEqual(contact_dict_rel, expected_contact_dict_rel)
 
     def test_insert_onetoone_violation_in_batch(self):
-        """Test O2O violation check within _process_entries_for_values (line 210)."""
+        """Test O2O violation check within _check_onetoone_values."""
         # Try inserting two ContactInfo entries for self.cust3 in the same batch
         contact_batch = [
             ContactInfo(phone="111", city="CityA", customer=self.cust3),
@@ -275,10 +276,46 @@ class TestOneToOneRelationshipEdgeCases(unittest.TestCase):
         ]
         with self.assertRaisesRegex(ValueError, "Duplicate entry detected within the batch for OneToOne field 'customer' with value 3 at index 1"):
             ContactInfo.insert_entries(contact_batch)
+        # The first offending row is reported, even if a later row clashes with the DB
+        with self.assertRaisesRegex(ValueError, "within the batch for OneToOne field 'customer' with value 3 at index 1"):
+            ContactInfo.insert_entries([
+                {"phone": "555", "customer": self.cust3.id},
+                {"phone": "666", "customer": {"id": self.cust3.id}},
+                {"phone": "777", "customer": self.cust1},
+            ])
+
+    def test_insert_onetoone_violation_against_database(self):
+        """Test O2O violation against rows already stored, found by the prefetch query."""
+        contact_batch = [
+            ContactInfo(phone="333", city="CityC", customer=self.cust3),
+            ContactInfo(phone="444", city="CityD", customer=self.cust1) # cust1 already has contact info
+        ]
+        with self.assertRaisesRegex(ValueError, "Error processing entry at index 1: Duplicate entry detected for customer \\(OneToOneField\\) with id 1"):
+            ContactInfo.insert_entries(contact_batch)
+        self.assertEqual(len(ContactInfo.objects.all()), 2) # Nothing from the batch was kept
+
+    def test_onetoone_column_is_unique_in_database(self):
+        """Test the OneToOne column itself rejects duplicates, not only the ORM checks."""
+        connection_obj = sqlite3.connect(DB_PATH)
+        try:
+            with self.assertRaisesRegex(sqlite3.IntegrityError, "UNIQUE constraint failed: contactinfo.customer_id"):
+                connection_obj.execute(
+                    "INSERT INTO contactinfo (phone, customer_id) VALUES (?, ?)", ("999", self.cust1.id))
+        finally:
+            connection_obj.close()
+
+    def test_insert_columns_onetoone_violation(self):
+        """Test insert_columns applies the same OneToOne checks as insert_entries."""
+        with self.assertRaisesRegex(ValueError, "within the batch for OneToOne field 'customer' with value 3 at index 1"):
+            ContactInfo.insert_columns({"phone": ["1", "2"], "customer": [self.cust3, self.cust3]})
+        with self.assertRaisesRegex(ValueError, "Error processing entry at index 1: Duplicate entry detected for customer \\(OneToOneField\\) with id 1"):
+            ContactInfo.insert_columns({"phone": ["1", "2"], "customer": [self.cust3, self.cust1]})
+        self.assertEqual(len(ContactInfo.objects.all()), 2)
 
     @classmethod
     def tearDownClass(cls):
         """Clean up the database after tests."""
+        base.close_connections()
         if os.path.exists(DB_PATH):
             os.remove(DB_PATH)
         if os.path.exists('databases'):
@@ -306,7 +343,7 @@ class TestM2MAsDictError(unittest.TestCase):
         connection_obj.commit()
         connection_obj.close()
 
-    @patch('ORM.fields.ManyToManyRelatedManager.all')
+    @patch('ORM.base.BaseModel._fetch_m2m_ids')
     def test_as_dict_m2m_error(self, mock_m2m_all):
         """Test as_dict M2M error handling (lines 108-111)."""
         # Setup data
@@ -316,7 +353,7 @@ class TestM2MAsDictError(unittest.TestCase):
         Book.insert_entries([book])
         book.authors.add(author) # Add relationship
 
-        # Configure mock to raise error when .all() is called within as_dict
+        # Configure mock to raise error when the junction tables are read within as_dict
         mock_m2m_all.side_effect = Exception("Simulated M2M fetch error")
 
         # Call as_dict and check output
@@ -333,6 +370,7 @@ class TestM2MAsDictError(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
+        base.close_connections()
         if os.path.exists(DB_PATH):
             os.remove(DB_PATH)
         if os.path.exists('databases'):
@@ -447,6 +485,7 @@ class TestForeignKeyFeatures(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
+        base.close_connections()
         if os.path.exists(DB_PATH):
             os.remove(DB_PATH)
         if os.path.exists('databases'):
@@ -563,6 +602,7 @@ class TestManyToManyFieldFeatures(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
+        base.close_connections()
         if os.path.exists(DB_PATH):
             os.remove(DB_PATH)
         if os.path.exists('databases'):
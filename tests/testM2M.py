@@ -227,6 +227,69 @@ class TestManyToManyRelationships(unittest.TestCase):
         self.assertEqual(authors[0].id, orwell.id)
         self.assertEqual(authors[0].name, "George Orwell")
 
+    def test_set_m2m_relationship(self):
+        """Test set() replaces the related objects, keeping unchanged links."""
+        harry_potter = self.harry_potter
+        harry_potter.authors.add(self.rowling, self.orwell)
+
+        harry_potter.authors.set([self.orwell, self.christie])
+        self.assertSetEqual({a.id for a in harry_potter.authors.all()},
+                            {self.orwell.id, self.christie.id})
+
+        harry_potter.authors.set([])
+        self.assertEqual(len(harry_potter.authors.all()), 0)
+
+        with self.assertRaisesRegex(ValueError, "Cannot add unsaved 'author' instance"):
+            harry_potter.authors.set([Author(name="Unsaved Author")])
+
+    def test_prefetch_m2m(self):
+        """Test ManyToManyField.prefetch() loads related objects for many instances at once."""
+        self.harry_potter.authors.add(self.rowling, self.orwell)
+        books = list(Book.objects.all())
+
+        Book.authors.prefetch(books)
+
+        # Prefetched results are served without querying the junction table
+        connection_obj = sqlite3.connect(DB_PATH)
+        connection_obj.execute("DELETE FROM book_author")
+        connection_obj.commit()
+        connection_obj.close()
+        self.assertEqual([a.name for a in books[0].authors.all()], ["J.K. Rowling", "George Orwell"])
+        self.assertEqual(list(books[1].authors.all()), [])
+
+        # Writes through the manager drop the cache
+        books[0].authors.add(self.christie)
+        self.assertEqual([a.id for a in books[0].authors.all()], [self.christie.id])
+
+        # So does bulk_link_m2m for the source instances it is given
+        Book.authors.prefetch(books)
+        Book.bulk_link_m2m("authors", [(books[1], self.rowling)])
+        self.assertEqual([a.id for a in books[1].authors.all()], [self.rowling.id])
+
+    def test_rebuild_recreates_changed_junction_table(self):
+        """Test a changed M2M definition rebuilds its junction table."""
+        class Shelf(base.BaseModel):
+            label = datatypes.CharField()
+            books = base.ManyToManyField(to=Book, through="shelf_items")
+        Shelf.create_table()
+        connection_obj = sqlite3.connect(DB_PATH)
+        connection_obj.execute("DROP TABLE shelf_items")
+        # Stand-in for a junction table left over from an older definition
+        connection_obj.execute("CREATE TABLE shelf_items (id INTEGER PRIMARY KEY, legacy TEXT)")
+        connection_obj.commit()
+        connection_obj.close()
+
+        class Shelf(base.BaseModel):  # Same table, changed M2M
+            label = datatypes.CharField()
+            books = base.ManyToManyField(to=Book, through="shelf_items")
+            authors = base.ManyToManyField(to=Author)
+        Shelf.create_table()
+
+        connection_obj = sqlite3.connect(DB_PATH)
+        columns = [row[1] for row in connection_obj.execute("PRAGMA table_info(shelf_items)")]
+        connection_obj.close()
+        self.assertEqual(columns, ["id", "shelf_id", "book_id"])
+
     def test_empty_relationships(self):
         """Test retrieving relationships when none exist using manager."""
         # Use instance from setUp
@@ -288,9 +351,57 @@ class TestManyToManyRelationships(unittest.TestCase):
         }
         self.assertDictEqual(book_dict, expected_dict)
 
+    def test_bulk_as_dict(self):
+        """Test bulk_as_dict() matches as_dict() for a batch of instances."""
+        self.harry_potter.authors.add(self.rowling, self.orwell)
+        self.nineteen_eighty_four.authors.add(self.orwell)
+        unsaved_book = Book(title="Unsaved Book")
+        books = [self.harry_potter, self.nineteen_eighty_four, unsaved_book]
+
+        dicts = Book.bulk_as_dict(books)
+
+        self.assertEqual(len(dicts), 3)
+        self.assertEqual(dicts[0]['title'], "Harry Potter")
+        self.assertSetEqual(set(dicts[0]['authors']), {self.rowling.id, self.orwell.id})
+        self.assertDictEqual(dicts[1], self.nineteen_eighty_four.as_dict())
+        self.assertDictEqual(dicts[2], {'id': None, 'title': "Unsaved Book", 'authors': []})
+
+        # The same serialization straight from a QuerySet
+        self.assertListEqual(Book.objects.filter(id=self.harry_potter.id).as_dicts(),
+                             [self.harry_potter.as_dict()])
+
+    def test_bulk_link_m2m(self):
+        """Test bulk_link_m2m() adds many links at once and skips existing ones."""
+        self.harry_potter.authors.add(self.rowling)
+        linked = Book.bulk_link_m2m("authors", [
+            (self.harry_potter, self.rowling),  # Already linked
+            (self.harry_potter, self.orwell.id),
+            (self.nineteen_eighty_four.id, {'id': self.orwell.id}),
+        ])
+        self.assertEqual(linked, 2)
+        self.assertSetEqual({a.id for a in self.harry_potter.authors.all()},
+                            {self.rowling.id, self.orwell.id})
+        self.assertEqual([a.id for a in self.nineteen_eighty_four.authors.all()], [self.orwell.id])
+
+        with self.assertRaisesRegex(ValueError, "not a ManyToManyField"):
+            Book.bulk_link_m2m("title", [])
+
+    def test_bulk_link_m2m_rejects_invalid_instances(self):
+        """Test bulk_link_m2m() validates instances like the manager's add()."""
+        with self.assertRaisesRegex(TypeError, "Can only link 'Author' instances"):
+            Book.bulk_link_m2m("authors", [(self.harry_potter, self.rowling),
+                                           (self.harry_potter, self.nineteen_eighty_four)])
+        with self.assertRaisesRegex(TypeError, "Can only link 'Book' instances"):
+            Book.bulk_link_m2m("authors", [(self.rowling, self.rowling)])
+        with self.assertRaisesRegex(ValueError, "Cannot link unsaved 'author' instance"):
+            Book.bulk_link_m2m("authors", [(self.harry_potter, Author(name="Unsaved"))])
+        # Nothing from the rejected batches was linked
+        self.assertEqual(len(self.harry_potter.authors.all()), 0)
+
     @classmethod
     def tearDownClass(cls):
         """Clean up the database file after all tests."""
+        base.close_connections()
         if os.path.exists(DB_PATH):
             os.remove(DB_PATH)
         # Attempt to remove directory if empty
@@ -3,6 +3,8 @@ import os
 import shutil
 from pathlib import Path
 
+from ORM.base import close_connections
+
 
 class TestMigrationHistory(unittest.TestCase):
     def setUp(self):
@@ -74,6 +76,7 @@ def migrate():
         """Clean up the migrations directory and database."""
         if self.migrations_dir.exists():
             shutil.rmtree(self.migrations_dir)
+        close_connections()
         if os.path.exists("databases/main.sqlite3"):
             os.remove("databases/main.sqlite3")
         if os.path.exists("databases"):
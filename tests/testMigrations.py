@@ -3,7 +3,7 @@ import os
 import shutil
 from pathlib import Path
 from ORM.manager import find_models, generate_migrations, apply_migrations
-from ORM.base import BaseModel
+from ORM.base import BaseModel, close_connections
 from ORM.datatypes import CharField
 
 # Temporary test directory for models
@@ -545,6 +545,7 @@ def migrate():
         """Clean up the migrations directory and database."""
         if self.migrations_dir.exists():
             shutil.rmtree(self.migrations_dir)
+        close_connections()
         if os.path.exists("databases/main.sqlite3"):
             os.remove("databases/main.sqlite3")
         if os.path.exists("databases"):